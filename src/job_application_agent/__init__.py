@@ -6,7 +6,15 @@ __version__ = "1.0.0"
 __author__ = "Developer"
 __description__ = "Offline AI-Powered Job Application Agent for Java Backend Developers"
 
-from .core.agent import JobApplicationAgent
-from .core.config import Config, UserProfile
-
 __all__ = ["JobApplicationAgent", "Config", "UserProfile"]
+
+def __getattr__(name):
+    # Imported on first access: worker processes that only unpickle a small
+    # helper module must not open the database or load config on import
+    if name == "JobApplicationAgent":
+        from .core.agent import JobApplicationAgent
+        return JobApplicationAgent
+    if name in ("Config", "UserProfile"):
+        from .core import config
+        return getattr(config, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,6 +7,13 @@ import logging
 import sys
 from pathlib import Path
 
+# libuv-based event loop, when installed (not available on Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Add src to path for development
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -22,6 +29,8 @@ async def main():
     logger = logging.getLogger(__name__)
     logger.info("Starting Job Application Agent...")
 
+    # Bound before the try so the finally can always shut it down
+    agent = None
     try:
         # Check if encryption key is set
         if not config.database.encryption_key:
@@ -36,13 +45,28 @@ async def main():
         # Start the agent
         await agent.start()
 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        # asyncio.run/Runner deliver Ctrl-C to main() as a cancellation
         logger.info("Received interrupt signal, shutting down...")
-        if 'agent' in locals():
-            await agent.stop()
+        raise
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         sys.exit(1)
+    finally:
+        # Close the database, browsers, process pool and HTTP clients
+        if agent is not None:
+            await agent.stop()
+
+def run():
+    """Run main() on uvloop if available, else on the default event loop."""
+    if not UVLOOP_AVAILABLE:
+        asyncio.run(main())
+    elif sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
+    else:
+        uvloop.install()
+        asyncio.run(main())
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
@@ -4,21 +4,87 @@ AI-powered cover letter generator using local LLM.
 
 import logging
 import asyncio
-import aiohttp
-import json
-from typing import Dict, Any, Optional
+import aiofiles
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Set, Callable, Awaitable, TYPE_CHECKING
 from pathlib import Path
-from ..core.config import config
+from ..core.config import config, ProfileSnapshot
+from ..utils import json_codec
+
+if TYPE_CHECKING:
+    import aiohttp
 
 logger = logging.getLogger(__name__)
 
+TokenCallback = Callable[[str], Awaitable[None]]
+
+# Directories already created in this process
+_dirs_ready: Set[Path] = set()
+
+# Number of generated texts kept in memory on top of the disk cache
+_MEMORY_CACHE_SIZE = 256
+
+# Fixed parts of the cover letter prompt; the job block goes between them
+_PROMPT_PREFIX = "Write a professional cover letter for a Java backend developer position.\n\n"
+_PROMPT_TAIL = """Requirements:
+1. Keep it professional and concise (250-300 words)
+2. Highlight relevant Java backend skills
+3. Show enthusiasm for the specific company and role
+4. Mention 2-3 key technical skills that match the job requirements
+5. Use a confident but humble tone
+6. End with a call to action
+
+Please write only the cover letter content, no additional text or formatting."""
+
 class CoverLetterGenerator:
     """Generates personalized cover letters using Ollama."""
 
-    def __init__(self):
+    def __init__(self, profile: Optional[ProfileSnapshot] = None):
         self.ollama_url = config.ai.ollama_base_url
         self.model = config.ai.ollama_model
+        self.profile = profile or ProfileSnapshot.from_profile(config.user_profile)
         self.templates = self._load_templates()
+        self._user_skills_csv = ", ".join(self.profile.skills)
+        self._user_skills_top5 = ", ".join(self.profile.skills[:5])
+
+        # Everything below depends only on the user profile, so render it once
+        self._profile_block = (
+            "Candidate Profile:\n"
+            f"- Name: {self.profile.name}\n"
+            f"- Education: {self.profile.education}\n"
+            f"- Experience: {self.profile.experience_years} years\n"
+            f"- Skills: {self._user_skills_csv}\n\n"
+        )
+        self._fallback_letter = self._render_template_cover_letter()
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+        # Generated texts keyed by a hash of model + prompt
+        self._cache_dir = Path(config.data_dir) / "cache" / "cover_letters"
+        self._memory_cache: "OrderedDict[str, str]" = OrderedDict()
+
+    async def _session_get(self) -> "aiohttp.ClientSession":
+        """Get the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=16,
+                keepalive_timeout=30,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=60)
+            )
+        return self._session
+
+    async def aclose(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     def _load_templates(self) -> Dict[str, str]:
         """Load cover letter templates."""
@@ -48,81 +114,109 @@ Best regards,
             """.strip()
         }
 
-    async def generate_cover_letter(self, job_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def generate_cover_letter(self, job_data: Dict[str, Any],
+                                    on_token: Optional[TokenCallback] = None) -> Optional[Dict[str, Any]]:
         """Generate a personalized cover letter for a job."""
         try:
-            # Extract job information
-            job_title = job_data.get('title', '')
-            company_name = job_data.get('company', '')
-            job_description = job_data.get('description', '')
-            job_requirements = job_data.get('requirements', '')
-
             # Create prompt for AI
-            prompt = self._create_cover_letter_prompt(
-                job_title, company_name, job_description, job_requirements
-            )
+            prompt = self._create_job_prompt(job_data)
 
             # Generate cover letter using Ollama
-            cover_letter_text = await self._call_ollama(prompt)
-
-            if cover_letter_text:
-                # Save cover letter to file
-                file_path = await self._save_cover_letter(
-                    cover_letter_text, job_data.get('job_id', 'unknown')
-                )
-
-                return {
-                    'text': cover_letter_text,
-                    'file_path': file_path,
-                    'generated_at': asyncio.get_event_loop().time()
-                }
+            cover_letter_text = await self._call_ollama(prompt, on_token)
 
-            return None
+            return await self._finalize_cover_letter(job_data, cover_letter_text)
 
         except Exception as e:
             logger.error(f"Error generating cover letter: {e}")
             return None
 
-    def _create_cover_letter_prompt(self, job_title: str, company_name: str, 
-                                  job_description: str, job_requirements: str) -> str:
-        """Create a prompt for the AI model."""
-        user_skills = ", ".join(config.user_profile.skills)
+    async def generate_cover_letters(self, jobs: List[Dict[str, Any]],
+                                     concurrency: int = 8) -> List[Optional[Dict[str, Any]]]:
+        """
+        Generate cover letters for several jobs concurrently.
 
-        prompt = f"""
-Write a professional cover letter for a Java backend developer position.
+        Results are returned in the same order as ``jobs``. The Ollama server only
+        decodes requests in parallel when started with ``OLLAMA_NUM_PARALLEL`` > 1;
+        otherwise requests queue up server-side.
+        """
+        try:
+            prompts = [self._create_job_prompt(job_data) for job_data in jobs]
+            texts = await self._call_ollama_batch(prompts, concurrency)
+        except Exception as e:
+            logger.error(f"Error generating cover letters: {e}")
+            return [None] * len(jobs)
+
+        return list(await asyncio.gather(*(
+            self._finalize_cover_letter(job_data, text)
+            for job_data, text in zip(jobs, texts)
+        )))
+
+    def _create_job_prompt(self, job_data: Dict[str, Any]) -> str:
+        """Create the AI prompt for a job record."""
+        return self._create_cover_letter_prompt(
+            job_data.get('title', ''),
+            job_data.get('company', ''),
+            job_data.get('description', ''),
+            job_data.get('requirements', '')
+        )
 
-Job Details:
-- Position: {job_title}
-- Company: {company_name}
-- Job Description: {job_description[:500]}...
-- Requirements: {job_requirements[:300]}...
+    async def _finalize_cover_letter(self, job_data: Dict[str, Any],
+                                     cover_letter_text: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Save generated text and wrap it in a cover letter record."""
+        if not cover_letter_text:
+            return None
 
-Candidate Profile:
-- Name: {config.user_profile.name}
-- Education: {config.user_profile.education}
-- Experience: {config.user_profile.experience_years} years
-- Skills: {user_skills}
+        try:
+            # Save cover letter to file
+            file_path = await self._save_cover_letter(
+                cover_letter_text, job_data.get('job_id', 'unknown')
+            )
 
-Requirements:
-1. Keep it professional and concise (250-300 words)
-2. Highlight relevant Java backend skills
-3. Show enthusiasm for the specific company and role
-4. Mention 2-3 key technical skills that match the job requirements
-5. Use a confident but humble tone
-6. End with a call to action
+            return {
+                'text': cover_letter_text,
+                'file_path': file_path,
+                'generated_at': asyncio.get_event_loop().time()
+            }
 
-Please write only the cover letter content, no additional text or formatting.
+        except Exception as e:
+            logger.error(f"Error generating cover letter: {e}")
+            return None
+
+    def _create_cover_letter_prompt(self, job_title: str, company_name: str, 
+                                  job_description: str, job_requirements: str) -> str:
+        """Create a prompt for the AI model."""
+        return "".join((
+            _PROMPT_PREFIX,
+            "Job Details:\n",
+            "- Position: ", job_title, "\n",
+            "- Company: ", company_name, "\n",
+            "- Job Description: ", job_description[:500], "...\n",
+            "- Requirements: ", job_requirements[:300], "...\n\n",
+            self._profile_block,
+            _PROMPT_TAIL
+        ))
+
+    async def _call_ollama(self, prompt: str,
+                           on_token: Optional[TokenCallback] = None) -> Optional[str]:
         """
+        Call Ollama API to generate text.
 
-        return prompt.strip()
+        The response is streamed as newline-delimited JSON records; ``on_token`` is
+        awaited with each partial chunk of text as it arrives. Successful
+        generations are cached by prompt, so a repeated prompt returns at once.
+        """
+        cache_key = self._cache_key(prompt)
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            if on_token is not None:
+                await on_token(cached)
+            return cached
 
-    async def _call_ollama(self, prompt: str) -> Optional[str]:
-        """Call Ollama API to generate text."""
         try:
             payload = {
                 "model": self.model,
                 "prompt": prompt,
-                "stream": False,
+                "stream": True,
                 "options": {
                     "temperature": config.ai.temperature,
                     "top_p": 0.9,
@@ -130,59 +224,148 @@ Please write only the cover letter content, no additional text or formatting.
                 }
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.ollama_url}/api/generate",
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=60)
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        return result.get('response', '').strip()
-                    else:
-                        logger.error(f"Ollama API error: {response.status}")
+            session = await self._session_get()
+            async with session.post(
+                f"{self.ollama_url}/api/generate",
+                data=json_codec.dumps(payload),
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                if response.status != 200:
+                    logger.error(f"Ollama API error: {response.status}")
+                    return None
+
+                parts: List[str] = []
+                async for line in response.content:
+                    line = line.strip()
+                    if not line:
+                        continue
+
+                    record = json_codec.loads(line)
+                    if record.get('error'):
+                        logger.error(f"Ollama API error: {record['error']}")
                         return None
 
+                    chunk = record.get('response', '')
+                    if chunk:
+                        parts.append(chunk)
+                        if on_token is not None:
+                            await on_token(chunk)
+
+                    if record.get('done'):
+                        break
+
+                text = "".join(parts).strip()
+
+            if text:
+                await self._cache_put(cache_key, text)
+            return text
+
         except Exception as e:
             logger.error(f"Error calling Ollama API: {e}")
             # Fallback to template-based generation
             return self._generate_template_cover_letter(prompt)
 
+    def _cache_key(self, prompt: str) -> str:
+        """Content-addressed cache key for a prompt."""
+        return hashlib.blake2b(
+            f"{self.model}\0{prompt}".encode('utf-8'), digest_size=16
+        ).hexdigest()
+
+    async def _cache_get(self, key: str) -> Optional[str]:
+        """Look up a generated text in memory, then on disk."""
+        text = self._memory_cache.get(key)
+        if text is not None:
+            self._memory_cache.move_to_end(key)
+            return text
+
+        cache_file = self._cache_dir / f"{key}.txt"
+        if not cache_file.exists():
+            return None
+
+        try:
+            async with aiofiles.open(cache_file, 'r', encoding='utf-8') as f:
+                text = await f.read()
+        except Exception as e:
+            logger.warning(f"Could not read cached cover letter: {e}")
+            return None
+
+        self._remember(key, text)
+        return text
+
+    async def _cache_put(self, key: str, text: str):
+        """Store a generated text in memory and on disk."""
+        self._remember(key, text)
+        try:
+            if self._cache_dir not in _dirs_ready:
+                self._cache_dir.mkdir(parents=True, exist_ok=True)
+                _dirs_ready.add(self._cache_dir)
+
+            async with aiofiles.open(self._cache_dir / f"{key}.txt", 'w', encoding='utf-8') as f:
+                await f.write(text)
+        except Exception as e:
+            logger.warning(f"Could not cache cover letter: {e}")
+
+    def _remember(self, key: str, text: str):
+        """Add a text to the bounded in-memory cache."""
+        self._memory_cache[key] = text
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > _MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
+
+    async def _call_ollama_batch(self, prompts: List[str], concurrency: int = 8) -> List[Optional[str]]:
+        """
+        Generate text for several prompts.
+
+        Ollama's ``/api/generate`` accepts a single prompt per request, so the batch
+        is issued as concurrent single calls bounded by ``concurrency``.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call_one(prompt: str) -> Optional[str]:
+            async with semaphore:
+                return await self._call_ollama(prompt)
+
+        return list(await asyncio.gather(*(call_one(prompt) for prompt in prompts)))
+
     def _generate_template_cover_letter(self, prompt: str) -> str:
         """Generate a cover letter using templates as fallback."""
+        return self._fallback_letter
+
+    def _render_template_cover_letter(self) -> str:
+        """Render the fallback template; every field is job-independent."""
         template = self.templates["professional"]
 
-        # Extract basic information from prompt
+        # The fallback has no job details, so generic defaults are used
         job_title = "Java Developer"  # Default
         company_name = "the company"  # Default
 
         # Simple template substitution
-        cover_letter = template.format(
+        return template.format(
             job_title=job_title,
             company_name=company_name,
-            user_education=config.user_profile.education,
-            user_experience=config.user_profile.experience_years,
-            user_skills=", ".join(config.user_profile.skills[:5]),
+            user_education=self.profile.education,
+            user_experience=self.profile.experience_years,
+            user_skills=self._user_skills_top5,
             job_requirements_match="Strong experience in Java, Spring Boot, and REST APIs",
-            user_name=config.user_profile.name
+            user_name=self.profile.name
         )
 
-        return cover_letter
-
     async def _save_cover_letter(self, content: str, job_id: str) -> str:
         """Save cover letter to file."""
         try:
             # Create cover letters directory
             cover_letters_dir = Path(config.data_dir) / "resumes" / "generated"
-            cover_letters_dir.mkdir(parents=True, exist_ok=True)
+            if cover_letters_dir not in _dirs_ready:
+                cover_letters_dir.mkdir(parents=True, exist_ok=True)
+                _dirs_ready.add(cover_letters_dir)
 
             # Create filename
             filename = f"cover_letter_{job_id}_{int(asyncio.get_event_loop().time())}.txt"
             file_path = cover_letters_dir / filename
 
             # Save content
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
+                await f.write(content)
 
             logger.info(f"Cover letter saved: {file_path}")
             return str(file_path)
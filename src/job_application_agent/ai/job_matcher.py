@@ -3,11 +3,93 @@ AI-powered job matching system.
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Set, Tuple, Iterable, TYPE_CHECKING
 import re
 
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` when numba is not installed."""
+        return lambda func: func
+
 logger = logging.getLogger(__name__)
 
+# Primary title keywords (high match)
+_PRIMARY_KEYWORDS = (
+    'java developer', 'backend developer', 'software engineer',
+    'java backend', 'spring developer', 'full stack developer'
+)
+
+# Secondary title keywords (medium match)
+_SECONDARY_KEYWORDS = (
+    'software developer', 'application developer', 'systems engineer',
+    'programmer', 'developer', 'engineer'
+)
+
+# Negative title keywords (reduce score)
+_NEGATIVE_KEYWORDS = (
+    'senior', 'lead', 'principal', 'architect', 'manager',
+    'director', 'head', 'vp', 'chief'
+)
+
+# Skill categories used for description matching
+_SKILL_CATEGORIES = {
+    'primary': ('java', 'spring boot', 'spring framework'),
+    'secondary': ('rest api', 'microservices', 'spring security', 'mvc'),
+    'tertiary': ('mysql', 'postgresql', 'sql', 'git', 'maven', 'gradle'),
+    'bonus': ('junit', 'hibernate', 'redis', 'kafka', 'docker')
+}
+
+# All keyword groups scanned by the matcher, keyed by group name
+_TITLE_GROUPS = ('title_primary', 'title_secondary', 'title_negative')
+_TERM_GROUPS = {
+    'title_primary': _PRIMARY_KEYWORDS,
+    'title_secondary': _SECONDARY_KEYWORDS,
+    'title_negative': _NEGATIVE_KEYWORDS,
+    **_SKILL_CATEGORIES
+}
+
+# Column layout of the batch skill matrix: one column per skill
+_SKILL_INDEX = {
+    skill: index
+    for index, skill in enumerate(
+        skill for skills in _SKILL_CATEGORIES.values() for skill in skills
+    )
+}
+_CATEGORY_COLUMNS = {
+    category: [_SKILL_INDEX[skill] for skill in skills]
+    for category, skills in _SKILL_CATEGORIES.items()
+}
+
+# Weights of the (title, skills, experience, location) score components
+_COMPONENT_WEIGHTS = (0.3, 0.4, 0.2, 0.1)
+
+_FRESHER_TERMS = ('fresher', 'entry level', '0-1', '0-2')
+_EXP_RE = re.compile(r'(\d+)[-\s]*(\d+)?\s*years?')
+
+@njit(cache=True, fastmath=True)
+def _exp_score(min_exp: int, max_exp: int, user_exp: float) -> float:
+    """Score how well the user's experience fits a required range."""
+    if min_exp <= user_exp <= max_exp:
+        return 1.0
+    elif user_exp < min_exp:
+        return max(0.0, 1.0 - (min_exp - user_exp) * 0.2)
+    else:
+        return max(0.0, 1.0 - (user_exp - max_exp) * 0.1)
+
 class JobMatcher:
     """Matches jobs against user profile and preferences."""
 
@@ -19,97 +101,146 @@ class JobMatcher:
             'tertiary': 0.2,   # Database/tools
             'bonus': 0.1       # Additional skills
         }
+        self._automaton = self._build_automaton() if AHOCORASICK_AVAILABLE else None
+
+        # Profile-derived values never change at runtime, so normalize them once
+        preferred_locations = user_profile.get('preferred_locations', [])
+        self._remote_preferred = 'Remote' in preferred_locations
+        self._locations_lower = tuple(location.lower() for location in preferred_locations)
+        self._user_experience = user_profile.get('experience_years', 1)
+
+    @staticmethod
+    def _build_automaton():
+        """Build a single Aho-Corasick automaton over every keyword group."""
+        term_groups: Dict[str, List[str]] = {}
+        for group, terms in _TERM_GROUPS.items():
+            for term in terms:
+                term_groups.setdefault(term, []).append(group)
+
+        automaton = ahocorasick.Automaton()
+        for term, groups in term_groups.items():
+            automaton.add_word(term, (term, tuple(groups)))
+        automaton.make_automaton()
+        return automaton
+
+    def _scan(self, text_lower: str, groups: Iterable[str]) -> Dict[str, Set[str]]:
+        """Find which terms of each keyword group occur in lowercased text."""
+        found: Dict[str, Set[str]] = {group: set() for group in groups}
+
+        if self._automaton is not None:
+            for _, (term, term_groups) in self._automaton.iter(text_lower):
+                for group in term_groups:
+                    if group in found:
+                        found[group].add(term)
+        else:
+            for group in found:
+                for term in _TERM_GROUPS[group]:
+                    if term in text_lower:
+                        found[group].add(term)
+
+        return found
 
     def calculate_match_score(self, job_data: Dict[str, Any]) -> float:
         """Calculate match score between job and user profile."""
-        score = 0.0
-
-        # Job title matching (30%)
-        title_score = self._calculate_title_match(job_data.get('title', ''))
-        score += title_score * 0.3
-
-        # Skills matching (40%)
-        skills_score = self._calculate_skills_match(
-            job_data.get('description', '') + ' ' + job_data.get('requirements', '')
+        # Title 30%, skills 40%, experience 20%, location 10%
+        score = sum(
+            component * weight
+            for component, weight in zip(self._score_components(job_data), _COMPONENT_WEIGHTS)
         )
-        score += skills_score * 0.4
-
-        # Experience matching (20%)
-        experience_score = self._calculate_experience_match(job_data.get('experience_required', ''))
-        score += experience_score * 0.2
-
-        # Location matching (10%)
-        location_score = self._calculate_location_match(job_data.get('location', ''))
-        score += location_score * 0.1
-
         return min(1.0, score)
 
-    def _calculate_title_match(self, job_title: str) -> float:
-        """Calculate how well the job title matches user preferences."""
-        title_lower = job_title.lower()
+    def _score_components(self, job_data: Dict[str, Any]) -> Tuple[float, float, float, float]:
+        """Score title, skills, experience and location from the normalized job."""
+        title_lower, text_lower, exp_lower, location_lower = self._normalize(job_data)
 
-        # Primary keywords (high match)
-        primary_keywords = [
-            'java developer', 'backend developer', 'software engineer',
-            'java backend', 'spring developer', 'full stack developer'
-        ]
+        return (
+            self._calculate_title_match(title_lower),
+            self._calculate_skills_match(text_lower),
+            self._calculate_experience_match(exp_lower),
+            self._calculate_location_match(location_lower)
+        )
 
-        # Secondary keywords (medium match)
-        secondary_keywords = [
-            'software developer', 'application developer', 'systems engineer',
-            'programmer', 'developer', 'engineer'
-        ]
+    @staticmethod
+    def _normalize(job_data: Dict[str, Any]) -> Tuple[str, str, str, str]:
+        """
+        Lowercase the matched fields of a job once per scoring call.
+
+        Returns (title, description + requirements, experience, location);
+        callers pass the tuple to the helpers instead of re-lowercasing. The
+        job dict is left untouched, so later edits to it are always seen.
+        """
+        return (
+            job_data.get('title', '').lower(),
+            (job_data.get('description', '') + ' ' + job_data.get('requirements', '')).lower(),
+            job_data.get('experience_required', '').lower(),
+            job_data.get('location', '').lower()
+        )
 
-        # Negative keywords (reduce score)
-        negative_keywords = [
-            'senior', 'lead', 'principal', 'architect', 'manager',
-            'director', 'head', 'vp', 'chief'
-        ]
+    def score_batch(self, jobs: List[Dict[str, Any]]) -> "np.ndarray":
+        """
+        Calculate match scores for a batch of jobs.
+
+        Equivalent to calling ``calculate_match_score`` per job, but the skills
+        component is computed from a (jobs x skills) boolean hit matrix so the
+        per-category arithmetic runs in NumPy instead of the interpreter.
+        """
+        import numpy as np
+
+        n_jobs = len(jobs)
+        hit_matrix = np.zeros((n_jobs, len(_SKILL_INDEX)), dtype=bool)
+        title_scores = np.empty(n_jobs)
+        experience_scores = np.empty(n_jobs)
+        location_scores = np.empty(n_jobs)
+
+        for i, job_data in enumerate(jobs):
+            title_lower, text_lower, exp_lower, location_lower = self._normalize(job_data)
+            hits = self._scan(text_lower, _SKILL_CATEGORIES)
+            for skills in hits.values():
+                for skill in skills:
+                    hit_matrix[i, _SKILL_INDEX[skill]] = True
+
+            title_scores[i] = self._calculate_title_match(title_lower)
+            experience_scores[i] = self._calculate_experience_match(exp_lower)
+            location_scores[i] = self._calculate_location_match(location_lower)
+
+        skills_scores = np.zeros(n_jobs)
+        for category, columns in _CATEGORY_COLUMNS.items():
+            category_scores = np.minimum(1.0, hit_matrix[:, columns].sum(axis=1) / len(columns))
+            skills_scores += category_scores * self.skill_weights[category]
+
+        title_weight, skills_weight, experience_weight, location_weight = _COMPONENT_WEIGHTS
+        total = (
+            title_scores * title_weight
+            + skills_scores * skills_weight
+            + experience_scores * experience_weight
+            + location_scores * location_weight
+        )
+        return np.clip(total, 0.0, 1.0)
 
+    def _calculate_title_match(self, title_lower: str) -> float:
+        """Calculate how well the lowercased job title matches user preferences."""
+        hits = self._scan(title_lower, _TITLE_GROUPS)
         score = 0.0
 
-        # Check primary keywords
-        for keyword in primary_keywords:
-            if keyword in title_lower:
-                score += 0.8
-                break
-
-        # Check secondary keywords
-        if score == 0:
-            for keyword in secondary_keywords:
-                if keyword in title_lower:
-                    score += 0.6
-                    break
+        # Check primary keywords, then secondary keywords
+        if hits['title_primary']:
+            score += 0.8
+        elif hits['title_secondary']:
+            score += 0.6
 
         # Apply negative keyword penalty
-        for keyword in negative_keywords:
-            if keyword in title_lower:
-                score *= 0.3  # Significant penalty
-                break
+        if hits['title_negative']:
+            score *= 0.3  # Significant penalty
 
         return score
 
-    def _calculate_skills_match(self, text: str) -> float:
-        """Calculate skills match percentage."""
-        text_lower = text.lower()
-
-        # Categorize user skills
-        skill_categories = {
-            'primary': ['java', 'spring boot', 'spring framework'],
-            'secondary': ['rest api', 'microservices', 'spring security', 'mvc'],
-            'tertiary': ['mysql', 'postgresql', 'sql', 'git', 'maven', 'gradle'],
-            'bonus': ['junit', 'hibernate', 'redis', 'kafka', 'docker']
-        }
-
+    def _calculate_skills_match(self, text_lower: str) -> float:
+        """Calculate skills match percentage for lowercased text."""
+        hits = self._scan(text_lower, _SKILL_CATEGORIES)
         total_score = 0.0
 
-        for category, skills in skill_categories.items():
-            category_score = 0.0
-            skills_found = 0
-
-            for skill in skills:
-                if skill.lower() in text_lower:
-                    skills_found += 1
+        for category, skills in _SKILL_CATEGORIES.items():
+            skills_found = len(hits[category])
 
             if skills_found > 0:
                 category_score = min(1.0, skills_found / len(skills))
@@ -117,51 +248,42 @@ class JobMatcher:
 
         return total_score
 
-    def _calculate_experience_match(self, experience_text: str) -> float:
-        """Calculate experience level match."""
-        if not experience_text:
+    def _calculate_experience_match(self, exp_lower: str) -> float:
+        """Calculate experience level match for lowercased requirement text."""
+        if not exp_lower:
             return 0.5  # Neutral score if no info
 
-        exp_lower = experience_text.lower()
-        user_experience = self.user_profile.get('experience_years', 1)
+        user_experience = self._user_experience
 
         # Look for experience patterns
-        if any(term in exp_lower for term in ['fresher', 'entry level', '0-1', '0-2']):
+        if any(term in exp_lower for term in _FRESHER_TERMS):
             if user_experience <= 2:
                 return 1.0
             else:
                 return 0.3
 
         # Extract numeric experience requirements
-        experience_match = re.search(r'(\d+)[-\s]*(\d+)?\s*years?', exp_lower)
+        experience_match = _EXP_RE.search(exp_lower)
         if experience_match:
             min_exp = int(experience_match.group(1))
             max_exp = int(experience_match.group(2)) if experience_match.group(2) else min_exp + 2
 
-            if min_exp <= user_experience <= max_exp:
-                return 1.0
-            elif user_experience < min_exp:
-                return max(0.0, 1.0 - (min_exp - user_experience) * 0.2)
-            else:
-                return max(0.0, 1.0 - (user_experience - max_exp) * 0.1)
+            return _exp_score(min_exp, max_exp, float(user_experience))
 
         return 0.5  # Default neutral score
 
-    def _calculate_location_match(self, job_location: str) -> float:
-        """Calculate location preference match."""
-        if not job_location:
+    def _calculate_location_match(self, job_location_lower: str) -> float:
+        """Calculate location preference match for a lowercased location."""
+        if not job_location_lower:
             return 0.5
 
-        preferred_locations = self.user_profile.get('preferred_locations', [])
-        job_location_lower = job_location.lower()
-
         # Check for remote work
-        if 'remote' in job_location_lower and 'Remote' in preferred_locations:
+        if self._remote_preferred and 'remote' in job_location_lower:
             return 1.0
 
         # Check for city matches
-        for location in preferred_locations:
-            if location.lower() in job_location_lower:
+        for location in self._locations_lower:
+            if location in job_location_lower:
                 return 1.0
 
         return 0.2  # Low score for non-preferred locations
@@ -169,25 +291,21 @@ class JobMatcher:
     def get_match_reasons(self, job_data: Dict[str, Any]) -> List[str]:
         """Get reasons why a job matches or doesn't match."""
         reasons = []
+        title_score, skills_score, exp_score, _ = self._score_components(job_data)
 
         # Title analysis
-        title_score = self._calculate_title_match(job_data.get('title', ''))
         if title_score > 0.7:
             reasons.append("Excellent job title match")
         elif title_score > 0.4:
             reasons.append("Good job title match")
 
         # Skills analysis
-        skills_score = self._calculate_skills_match(
-            job_data.get('description', '') + ' ' + job_data.get('requirements', '')
-        )
         if skills_score > 0.6:
             reasons.append("Strong skills alignment")
         elif skills_score > 0.3:
             reasons.append("Moderate skills match")
 
         # Experience analysis
-        exp_score = self._calculate_experience_match(job_data.get('experience_required', ''))
         if exp_score > 0.8:
             reasons.append("Perfect experience level match")
         elif exp_score < 0.3:
@@ -1,26 +1,141 @@
 import logging
 import asyncio
 import random
-from typing import Dict, Any, Optional, TYPE_CHECKING, cast
-from playwright.async_api import async_playwright, Page, BrowserContext, ElementHandle
+from contextlib import asynccontextmanager
+from typing import Dict, Any, List, Optional, AsyncIterator, TYPE_CHECKING
 
+# Playwright is imported lazily: importing it is slow and many entry points
+# (matching, stats) never drive a browser.
 if TYPE_CHECKING:
-    from playwright.async_api import Browser
+    from playwright.async_api import Browser, BrowserContext, ElementHandle, Page, Playwright
+    from ..core.config import ProfileSnapshot
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for waiting on an element to appear
+SELECTOR_TIMEOUT_MS = 10_000
+
+# Subresources that application flows never need
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+async def _block_heavy_resources(route):
+    """Abort requests for images, fonts and media; let everything else through."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 class ApplicationHandler:
     """Handles automated job applications across different platforms."""
 
-    def __init__(self):
+    def __init__(self, profile: Optional["ProfileSnapshot"] = None):
+        if profile is None:
+            from ..core.config import config, ProfileSnapshot
+            profile = ProfileSnapshot.from_profile(config.user_profile)
+        self.profile = profile
+        self._playwright: Optional["Playwright"] = None
         self.browser: Optional["Browser"] = None
-        self.page: Optional[Page] = None
+        self._ctx_pool: Optional["asyncio.Queue[BrowserContext]"] = None
+        self._contexts: List["BrowserContext"] = []
+        self._pool_size = 0
+        self._start_lock = asyncio.Lock()
+
+    async def start(self, pool_size: int = 4, headless: bool = True):
+        """Launch the browser once and pre-create a pool of browser contexts."""
+        async with self._start_lock:
+            if self.browser is not None:
+                return
+            await self._launch(pool_size, headless)
+
+    @property
+    def pool_size(self) -> int:
+        """Number of pooled contexts, i.e. how many applications can run at once."""
+        return self._pool_size
+
+    async def _launch(self, pool_size: int, headless: bool):
+        """Launch Playwright, the browser and the context pool."""
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        self.browser = await self._playwright.chromium.launch(
+            headless=headless,
+            args=[
+                "--no-sandbox",
+                "--disable-dev-shm-usage",
+                "--disable-blink-features=AutomationControlled",
+            ],
+        )
 
-    def _check_page(self) -> Page:
-        """Check if page is initialized and return typed page object."""
-        if self.page is None:
-            raise RuntimeError("Browser page not initialized")
-        return cast(Page, self.page)
+        self._ctx_pool = asyncio.Queue()
+        for _ in range(pool_size):
+            context: "BrowserContext" = await self.browser.new_context(
+                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                viewport={"width": 1366, "height": 768},
+            )
+            await context.route("**/*", _block_heavy_resources)
+            self._contexts.append(context)
+            self._ctx_pool.put_nowait(context)
+        self._pool_size = pool_size
+
+        logger.info(f"Application browser started with {pool_size} contexts")
+
+    async def stop(self):
+        """Close all pooled contexts, the browser and Playwright."""
+        for context in self._contexts:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.error(f"Error closing browser context: {e}")
+        self._contexts = []
+        self._ctx_pool = None
+        self._pool_size = 0
+
+        try:
+            if self.browser:
+                await self.browser.close()
+            if self._playwright:
+                await self._playwright.stop()
+        except Exception as e:
+            logger.error(f"Error closing browser: {e}")
+        finally:
+            self.browser = None
+            self._playwright = None
+
+    @asynccontextmanager
+    async def _acquire_page(self) -> AsyncIterator["Page"]:
+        """Borrow a context from the pool and open a fresh page in it."""
+        if self.browser is None or self._ctx_pool is None:
+            await self.start()
+        # Local reference: stop() may clear _ctx_pool while this page is in use
+        pool = self._ctx_pool
+        assert pool is not None
+
+        context = await pool.get()
+        page: Optional["Page"] = None
+        try:
+            page = await context.new_page()
+            yield page
+        finally:
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception as e:
+                    logger.error(f"Error closing page: {e}")
+            pool.put_nowait(context)
+
+    async def _wait_for(self, page: "Page", selector: str,
+                        timeout: int = SELECTOR_TIMEOUT_MS) -> Optional["ElementHandle"]:
+        """Wait until an element is visible; return None if it never shows up."""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        try:
+            return await page.wait_for_selector(selector, state='visible', timeout=timeout)
+        except PlaywrightTimeoutError:
+            return None
+
+    async def _jitter(self):
+        """Short human-like pause before typing into a form."""
+        await asyncio.sleep(random.uniform(0.2, 0.6))
 
     async def apply_to_job(self, job_data: Dict[str, Any], cover_letter: Dict[str, Any]) -> bool:
         platform = job_data.get("source_platform", "").lower()
@@ -38,57 +153,33 @@ class ApplicationHandler:
             logger.error(f"Error applying to job {job_data.get('job_id')}: {e}")
             return False
 
-    async def _initialize_browser(self, headless: bool = True):
-        """Initialize browser for automation."""
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(
-            headless=headless,
-            args=[
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-blink-features=AutomationControlled",
-            ],
-        )
-        context: BrowserContext = await self.browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            viewport={"width": 1366, "height": 768},
-        )
-        self.page = await context.new_page()
-
     async def _apply_linkedin(self, job_data: Dict[str, Any], cover_letter: Dict[str, Any]) -> bool:
         """Apply to a LinkedIn job (Easy Apply)."""
         try:
-            await self._initialize_browser()
-            page = self._check_page()
-            await page.goto(job_data['source_url'])
-            await asyncio.sleep(random.uniform(2, 4))
-
-            easy_apply_button = await page.query_selector('.jobs-apply-button')
-            if easy_apply_button:
-                await easy_apply_button.click()
-                await asyncio.sleep(2)
-                success = await self._fill_linkedin_application_form(cover_letter)
-                return success
-            else:
-                logger.info("No Easy Apply button found for LinkedIn job")
-                return False
+            async with self._acquire_page() as page:
+                await page.goto(job_data['source_url'], wait_until='domcontentloaded')
+
+                easy_apply_button = await self._wait_for(page, '.jobs-apply-button')
+                if easy_apply_button:
+                    await easy_apply_button.click()
+                    success = await self._fill_linkedin_application_form(page, cover_letter)
+                    return success
+                else:
+                    logger.info("No Easy Apply button found for LinkedIn job")
+                    return False
 
         except Exception as e:
             logger.error(f"Error applying to LinkedIn job: {e}")
             return False
-        finally:
-            if self.browser:
-                await self.browser.close()
 
-    async def _fill_linkedin_application_form(self, cover_letter: Dict[str, Any]) -> bool:
+    async def _fill_linkedin_application_form(self, page: "Page", cover_letter: Dict[str, Any]) -> bool:
         """Fill LinkedIn application form."""
         try:
-            page = self._check_page()
-            await page.wait_for_selector('.jobs-easy-apply-modal', timeout=10000)
+            await page.wait_for_selector('.jobs-easy-apply-modal', timeout=SELECTOR_TIMEOUT_MS)
 
             max_steps = 5
             for step in range(max_steps):
-                await self._fill_common_form_fields()
+                await self._fill_common_form_fields(page)
 
                 cover_letter_field = await page.query_selector(
                     'textarea[name*="cover"], textarea[placeholder*="cover"]'
@@ -105,7 +196,7 @@ class ApplicationHandler:
                         logger.info("LinkedIn application submitted successfully")
                         return True
 
-                    await asyncio.sleep(2)
+                    await page.wait_for_load_state('domcontentloaded')
                 else:
                     break
 
@@ -115,81 +206,81 @@ class ApplicationHandler:
             logger.error(f"Error filling LinkedIn form: {e}")
             return False
 
-    async def _fill_common_form_fields(self):
+    async def _fill_common_form_fields(self, page: "Page"):
         """Fill common form fields with user profile data."""
-        from ..core.config import config
-        page = self._check_page()
+        await self._jitter()
 
-        phone_field = await page.query_selector('input[name*="phone"], input[type="tel"]')
-        if phone_field:
-            await phone_field.fill(config.user_profile.phone)
+        fills = [self._try_fill(page, 'input[name*="phone"], input[type="tel"]', self.profile.phone)]
+        if self.profile.preferred_locations:
+            fills.append(self._try_fill(
+                page,
+                'input[name*="location"], input[placeholder*="location"]',
+                self.profile.preferred_locations[0]
+            ))
 
-        location_field = await page.query_selector(
-            'input[name*="location"], input[placeholder*="location"]'
-        )
-        if location_field and config.user_profile.preferred_locations:
-            await location_field.fill(config.user_profile.preferred_locations[0])
+        # Independent fields: overlap their CDP round-trips
+        await asyncio.gather(*fills)
+
+    async def _try_fill(self, page: "Page", selector: str, value: str) -> bool:
+        """Fill the first element matching selector, if present."""
+        try:
+            field = await page.query_selector(selector)
+            if field:
+                await field.fill(value)
+                return True
+        except Exception as e:
+            logger.debug(f"Could not fill '{selector}': {e}")
+        return False
 
     async def _apply_naukri(self, job_data: Dict[str, Any], cover_letter: Dict[str, Any]) -> bool:
         """Apply to a Naukri job."""
         try:
-            await self._initialize_browser()
-            page = self._check_page()
-            await page.goto(job_data['source_url'])
-            await asyncio.sleep(random.uniform(2, 4))
+            async with self._acquire_page() as page:
+                await page.goto(job_data['source_url'], wait_until='domcontentloaded')
 
-            apply_button = await page.query_selector('.apply-button, .btn-apply')
-            if apply_button:
-                await apply_button.click()
-                await asyncio.sleep(2)
+                apply_button = await self._wait_for(page, '.apply-button, .btn-apply')
+                if apply_button:
+                    await apply_button.click()
+                    submit_button = await self._wait_for(page, '.btn-submit, .submit-btn')
 
-                await self._fill_common_form_fields()
+                    await self._fill_common_form_fields(page)
 
-                submit_button = await page.query_selector('.btn-submit, .submit-btn')
-                if submit_button:
-                    await submit_button.click()
-                    logger.info("Naukri application submitted successfully")
-                    return True
+                    if submit_button:
+                        await submit_button.click()
+                        logger.info("Naukri application submitted successfully")
+                        return True
 
-            return False
+                return False
 
         except Exception as e:
             logger.error(f"Error applying to Naukri job: {e}")
             return False
-        finally:
-            if self.browser:
-                await self.browser.close()
 
     async def _apply_indeed(self, job_data: Dict[str, Any], cover_letter: Dict[str, Any]) -> bool:
         """Apply to an Indeed job."""
         try:
-            await self._initialize_browser()
-            page = self._check_page()
-            await page.goto(job_data['source_url'])
-            await asyncio.sleep(random.uniform(2, 4))
+            async with self._acquire_page() as page:
+                await page.goto(job_data['source_url'], wait_until='domcontentloaded')
 
-            apply_button = await page.query_selector('.ia-IndeedApplyButton')
-            if apply_button:
-                await apply_button.click()
-                await asyncio.sleep(2)
+                apply_button = await self._wait_for(page, '.ia-IndeedApplyButton')
+                if apply_button:
+                    await apply_button.click()
+                    await self._wait_for(page, '.ia-continueButton')
 
-                await self._fill_common_form_fields()
+                    await self._fill_common_form_fields(page)
 
-                cover_letter_field = await page.query_selector('textarea[name*="coverletter"]')
-                if cover_letter_field and cover_letter.get('text'):
-                    await cover_letter_field.fill(cover_letter['text'])
+                    cover_letter_field = await page.query_selector('textarea[name*="coverletter"]')
+                    if cover_letter_field and cover_letter.get('text'):
+                        await cover_letter_field.fill(cover_letter['text'])
 
-                submit_button = await page.query_selector('.ia-continueButton')
-                if submit_button:
-                    await submit_button.click()
-                    logger.info("Indeed application submitted successfully")
-                    return True
+                    submit_button = await page.query_selector('.ia-continueButton')
+                    if submit_button:
+                        await submit_button.click()
+                        logger.info("Indeed application submitted successfully")
+                        return True
 
-            return False
+                return False
 
         except Exception as e:
             logger.error(f"Error applying to Indeed job: {e}")
             return False
-        finally:
-            if self.browser:
-                await self.browser.close()
\ No newline at end of file
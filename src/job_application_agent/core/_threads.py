@@ -0,0 +1,32 @@
+"""
+Lightweight helpers for running blocking work in the default executor.
+"""
+
+import asyncio
+import contextvars
+import functools
+import sys
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+if sys.version_info >= (3, 14):
+    # The stdlib already skips the context wrapper when the context is empty
+    to_thread_fast = asyncio.to_thread
+else:
+    async def to_thread_fast(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run func in the default executor, like asyncio.to_thread.
+
+        asyncio.to_thread always wraps the call in ``ctx.run`` through a
+        ``functools.partial``; when no context variables are set that
+        indirection buys nothing, so the call is handed over directly.
+        """
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+
+        if len(ctx) == 0:
+            if kwargs:
+                return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+            return await loop.run_in_executor(None, func, *args)
+
+        return await loop.run_in_executor(None, functools.partial(ctx.run, func, *args, **kwargs))
@@ -4,30 +4,90 @@ Main Job Application Agent class.
 
 import asyncio
 import logging
-from typing import List, Dict, Any
-from datetime import datetime
-
-from .config import config
+import random
+import re
+import sys
+import time
+from collections import OrderedDict
+from functools import cached_property
+from typing import List, Dict, Any, Iterable, Optional, Set, Tuple, TYPE_CHECKING
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from rapidfuzz import process, fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+from .config import config, ProfileSnapshot
 from .database import db
 from .scheduler import JobScheduler
 from .notifications import NotificationManager
-from ..scrapers.scraper_manager import ScraperManager
-from ..ai.cover_letter_generator import CoverLetterGenerator
-from ..automation.application_handler import ApplicationHandler
+from ._threads import to_thread_fast
+from ..models.job import Job
+
+if TYPE_CHECKING:
+    from ..scrapers.scraper_manager import ScraperManager
+    from ..ai.cover_letter_generator import CoverLetterGenerator
+    from ..automation.application_handler import ApplicationHandler
 
 logger = logging.getLogger(__name__)
 
+# Minimum RapidFuzz scores for a fuzzy keyword/skill hit
+TITLE_FUZZY_CUTOFF = 80
+SKILL_FUZZY_CUTOFF = 85
+# Shorter skills are only matched exactly: fuzzy-matching terms such as
+# "sql" or "git" hits unrelated words
+MIN_FUZZY_SKILL_LEN = 5
+
+# Words of a description, keeping dotted names such as "node.js" whole
+_WORD_RE = re.compile(r"[\w+#]+(?:\.[\w+#]+)*")
+
+# Skill matches beyond this don't raise the score (5 x 0.1 hits the 0.5 cap)
+MAX_SKILL_MATCHES = 5
+
+# Upper bound on how long the main loop sleeps between scheduler checks
+MAIN_LOOP_MAX_SLEEP = 300
+
+# Number of recently seen job ids remembered to skip re-scraped jobs
+SEEN_JOBS_MAX = 50_000
+
 class JobApplicationAgent:
     """Main agent class that orchestrates the job application process."""
 
     def __init__(self):
         self.config = config
         self.db = db
+        self.profile = ProfileSnapshot.from_profile(config.user_profile)
         self.scheduler = JobScheduler()
         self.notifications = NotificationManager()
-        self.scraper_manager = ScraperManager()
-        self.cover_letter_generator = CoverLetterGenerator()
-        self.application_handler = ApplicationHandler()
+
+        # Keyword/skill matchers are built once; the lists don't change at runtime
+        self._kw_lower = tuple(keyword.lower() for keyword in self.config.job_search.keywords)
+        self._skills_lower = tuple(skill.lower() for skill in self.config.user_profile.skills)
+        self._kw_automaton = self._build_automaton(self._kw_lower)
+        # Single-pass alternation for the title check when pyahocorasick is missing
+        self._kw_re = re.compile('|'.join(re.escape(keyword) for keyword in self._kw_lower)) if self._kw_lower else None
+        self._skill_automaton = self._build_automaton(self._skills_lower)
+        # (index, skill, word count) of the skills eligible for fuzzy matching
+        self._fuzzy_skills = tuple(
+            (index, skill, len(skill.split()))
+            for index, skill in enumerate(self._skills_lower)
+            if len(skill) >= MIN_FUZZY_SKILL_LEN
+        )
+        self._exp_terms = ('0-2', '0 to 2', 'fresher', 'entry level')
+
+        # LRU of job ids already scored/saved, oldest first
+        self._seen_jobs: "OrderedDict[str, None]" = OrderedDict()
+
+        # Application slots, each holding the monotonic time it may apply
+        # again; created lazily so the queue binds to the running event loop
+        self._apply_slots: Optional["asyncio.Queue[float]"] = None
 
         self.is_running = False
         self.stats = {
@@ -37,11 +97,43 @@ class JobApplicationAgent:
             'total_applications': 0
         }
 
+    # Scraping, cover letter and automation components are created on first
+    # use so that stats/dashboard-only runs never import them.
+
+    @cached_property
+    def scraper_manager(self) -> "ScraperManager":
+        """Job scrapers for all platforms."""
+        from ..scrapers.scraper_manager import ScraperManager
+        return ScraperManager()
+
+    @cached_property
+    def cover_letter_generator(self) -> "CoverLetterGenerator":
+        """Cover letter generator bound to the profile snapshot."""
+        from ..ai.cover_letter_generator import CoverLetterGenerator
+        return CoverLetterGenerator(self.profile)
+
+    @cached_property
+    def application_handler(self) -> "ApplicationHandler":
+        """Browser automation for submitting applications."""
+        from ..automation.application_handler import ApplicationHandler
+        return ApplicationHandler(self.profile)
+
     async def start(self):
         """Start the job application agent."""
         logger.info("Starting Job Application Agent...")
         self.is_running = True
 
+        # Run new tasks eagerly up to their first real suspension (Python 3.12+)
+        if sys.version_info >= (3, 12):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+        # Open the shared database connection
+        await self.db.connect()
+
+        # Jobs already in the database don't need to be scored or saved again
+        for job_id in reversed(await self.db.get_recent_job_ids(SEEN_JOBS_MAX)):
+            self._seen_jobs[job_id] = None
+
         # Schedule periodic tasks
         await self._schedule_tasks()
 
@@ -59,6 +151,16 @@ class JobApplicationAgent:
         """Stop the job application agent."""
         logger.info("Stopping Job Application Agent...")
         self.is_running = False
+        self.scheduler.wake()
+
+        # Only close the components that were actually created
+        if 'cover_letter_generator' in self.__dict__:
+            await self.cover_letter_generator.aclose()
+        if 'application_handler' in self.__dict__:
+            await self.application_handler.stop()
+        if 'scraper_manager' in self.__dict__:
+            await self.scraper_manager.close()
+        await self.db.close()
 
         await self.notifications.send_notification(
             "Job Agent Stopped",
@@ -96,8 +198,8 @@ class JobApplicationAgent:
                 # Process scheduled tasks
                 await self.scheduler.process_tasks()
 
-                # Small delay to prevent busy waiting
-                await asyncio.sleep(10)
+                # Sleep until the next task is due instead of polling
+                await self.scheduler.wait_until_next(MAIN_LOOP_MAX_SLEEP)
 
             except Exception as e:
                 logger.error(f"Error in main loop: {e}")
@@ -108,20 +210,42 @@ class JobApplicationAgent:
         logger.info("Starting job search...")
 
         try:
-            # Get jobs from all scrapers
-            all_jobs = await self.scraper_manager.search_all_platforms()
+            # Convert and filter jobs as the scrapers produce them, dropping
+            # ones already seen in earlier searches or earlier in this one
+            jobs: List[Job] = []
+            batch_ids = set()
+            found_count = 0
+            async for job_data in self.scraper_manager.stream_all_platforms():
+                found_count += 1
+                job = Job.from_dict(job_data)
+                if self._is_unseen(job.job_id, batch_ids):
+                    batch_ids.add(job.job_id)
+                    jobs.append(job)
+            logger.info(f"Total jobs found across all platforms: {found_count}")
+
+            # Score the whole batch off the event loop
+            scores = await to_thread_fast(self._score_jobs, jobs)
+
+            matching_jobs = []
+            rejected_jobs = []
+            for job, match_score in zip(jobs, scores):
+                job.match_score = match_score
+
+                # Keep job if match score is good
+                if match_score >= 0.6:  # 60% match threshold
+                    matching_jobs.append(job)
+                else:
+                    rejected_jobs.append(job)
 
-            new_jobs_count = 0
-            for job in all_jobs:
-                # Calculate match score
-                match_score = self._calculate_match_score(job)
-                job['match_score'] = match_score
+            # Below-threshold jobs won't score differently next time
+            self._mark_seen(rejected_jobs)
 
-                # Save to database if match score is good
-                if match_score >= 0.6:  # 60% match threshold
-                    saved = await self.db.save_job(job)
-                    if saved:
-                        new_jobs_count += 1
+            # Save all matching jobs in one transaction; they are only skipped
+            # from now on if the save went through, so failures are retried
+            new_jobs_count = 0
+            if matching_jobs and await self.db.save_jobs(matching_jobs):
+                new_jobs_count = len(matching_jobs)
+                self._mark_seen(matching_jobs)
 
             self.stats['jobs_found_today'] += new_jobs_count
 
@@ -137,6 +261,21 @@ class JobApplicationAgent:
         except Exception as e:
             logger.error(f"Error during job search: {e}")
 
+    def _is_unseen(self, job_id: str, batch_ids: Set[str]) -> bool:
+        """Whether job_id is neither remembered nor already in the current batch."""
+        if job_id in self._seen_jobs:
+            self._seen_jobs.move_to_end(job_id)
+            return False
+        return job_id not in batch_ids
+
+    def _mark_seen(self, jobs: List[Job]):
+        """Remember the jobs' ids so later searches skip them."""
+        for job in jobs:
+            self._seen_jobs[job.job_id] = None
+
+        while len(self._seen_jobs) > SEEN_JOBS_MAX:
+            self._seen_jobs.popitem(last=False)
+
     async def _process_pending_applications(self):
         """Process pending job applications."""
         logger.info("Processing pending applications...")
@@ -145,81 +284,205 @@ class JobApplicationAgent:
             # Get jobs that need applications
             pending_jobs = await self.db.get_jobs(status='discovered', limit=5)
 
-            for job in pending_jobs:
-                if self.stats['applications_sent_today'] >= self.config.job_search.max_applications_per_day:
+            # Only generate cover letters for jobs we can still apply to today
+            remaining = self.config.job_search.max_applications_per_day - self.stats['applications_sent_today']
+            if remaining <= 0:
+                if pending_jobs:
                     logger.info("Daily application limit reached")
-                    break
+                return
+            pending_jobs = pending_jobs[:remaining]
+
+            # Generate cover letters for the whole batch concurrently
+            cover_letters = await self.cover_letter_generator.generate_cover_letters(pending_jobs)
+
+            # Apply to the batch concurrently, one application per free slot.
+            # There is one slot per pooled browser context, so the pacing and
+            # the handler's concurrency limit are the same number.
+            if self._apply_slots is None:
+                await self.application_handler.start(
+                    pool_size=max(1, self.config.job_search.max_concurrent_applications),
+                    headless=self.config.browser.headless
+                )
+                self._apply_slots = asyncio.Queue()
+                for _ in range(self.application_handler.pool_size):
+                    self._apply_slots.put_nowait(0.0)
 
-                # Generate cover letter
-                cover_letter = await self.cover_letter_generator.generate_cover_letter(job)
-
-                if cover_letter:
-                    # Attempt to apply
-                    success = await self.application_handler.apply_to_job(job, cover_letter)
-
-                    if success:
-                        self.stats['applications_sent_today'] += 1
-
-                        # Update job status
-                        job['status'] = 'applied'
-                        await self.db.save_job(job)
-
-                        # Save application record
-                        await self.db.save_application({
-                            'job_id': job['job_id'],
-                            'status': 'submitted',
-                            'cover_letter_path': cover_letter.get('file_path')
-                        })
-
-                        await self.notifications.send_notification(
-                            "Application Submitted",
-                            f"Successfully applied to {job['title']} at {job['company']}",
-                            "application_success"
-                        )
-                    else:
-                        # Mark for manual review
-                        job['status'] = 'manual_review'
-                        await self.db.save_job(job)
-
-                        await self.notifications.send_notification(
-                            "Manual Review Required",
-                            f"Could not auto-apply to {job['title']} at {job['company']}",
-                            "application_failure"
-                        )
-
-                # Add delay between applications
-                await asyncio.sleep(self.config.job_search.application_delay_min * 60)
+            await asyncio.gather(*(
+                self._apply_one(job, cover_letter)
+                for job, cover_letter in zip(pending_jobs, cover_letters)
+            ))
 
         except Exception as e:
             logger.error(f"Error processing applications: {e}")
 
-    def _calculate_match_score(self, job: Dict[str, Any]) -> float:
-        """Calculate how well a job matches the user profile."""
-        score = 0.0
+    async def _apply_one(self, job: Dict[str, Any], cover_letter: Optional[Dict[str, Any]]):
+        """Apply to a single job and persist the outcome right away."""
+        if not cover_letter:
+            return
 
-        # Check title match
-        title = job.get('title', '').lower()
-        for keyword in self.config.job_search.keywords:
-            if keyword.lower() in title:
-                score += 0.3
-                break
-
-        # Check skills match
-        description = (job.get('description', '') + ' ' + job.get('requirements', '')).lower()
-        skill_matches = 0
-        for skill in self.config.user_profile.skills:
-            if skill.lower() in description:
-                skill_matches += 1
+        assert self._apply_slots is not None
+        ready_at = await self._apply_slots.get()
+        attempted = False
+        try:
+            # Pace applications per slot: wait out the delay that followed
+            # the slot's previous application, if it hasn't passed yet
+            wait = ready_at - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            if self.stats['applications_sent_today'] >= self.config.job_search.max_applications_per_day:
+                logger.info("Daily application limit reached")
+                return
+
+            attempted = True
+            # Attempt to apply
+            success = await self.application_handler.apply_to_job(job, cover_letter)
+
+            if success:
+                self.stats['applications_sent_today'] += 1
+
+                # Update job status and record the application in one
+                # transaction, before any delay, so a restart never
+                # applies to the same job twice
+                job['status'] = 'applied'
+                await self.db.save_application_results([(job['job_id'], 'applied')], [{
+                    'job_id': job['job_id'],
+                    'status': 'submitted',
+                    'cover_letter_path': cover_letter.get('file_path')
+                }])
+
+                await self.notifications.send_notification(
+                    "Application Submitted",
+                    f"Successfully applied to {job['title']} at {job['company']}",
+                    "application_success"
+                )
+            else:
+                # Mark for manual review
+                job['status'] = 'manual_review'
+                await self.db.save_application_results([(job['job_id'], 'manual_review')], [])
+
+                await self.notifications.send_notification(
+                    "Manual Review Required",
+                    f"Could not auto-apply to {job['title']} at {job['company']}",
+                    "application_failure"
+                )
+        finally:
+            if attempted:
+                # Jittered delay before this slot takes the next application
+                delay_minutes = random.uniform(
+                    self.config.job_search.application_delay_min,
+                    self.config.job_search.application_delay_max
+                )
+                ready_at = time.monotonic() + delay_minutes * 60
+            self._apply_slots.put_nowait(ready_at)
+
+    @staticmethod
+    def _build_automaton(terms: Iterable[str]) -> Optional[Any]:
+        """Build an Aho-Corasick automaton over lowercased terms, if available."""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for index, term in enumerate(terms):
+            if term:
+                automaton.add_word(term, index)
+
+        if len(automaton) == 0:
+            return None
+        automaton.make_automaton()
+        return automaton
+
+    def _score_jobs(self, jobs: List[Job]) -> List[float]:
+        """
+        Calculate match scores for a batch of jobs.
+
+        Each job is scanned once for its match features; the weighting is then
+        done for the whole batch in NumPy when it is installed.
+        """
+        features = [self._match_features(job) for job in jobs]
+        try:
+            import numpy as np
+        except ImportError:
+            return [self._combine_features(*job_features) for job_features in features]
 
+        if not features:
+            return []
+
+        title_hits, skill_counts, exp_hits = (np.array(column) for column in zip(*features))
+        scores = np.minimum(
+            1.0,
+            0.3 * title_hits + np.minimum(0.5, 0.1 * skill_counts) + 0.2 * exp_hits
+        )
+        return scores.tolist()
+
+    @staticmethod
+    def _combine_features(title_hit: bool, skill_matches: int, exp_hit: bool) -> float:
+        """Weight the match features of one job into a score."""
+        score = 0.0
+        if title_hit:
+            score += 0.3
         if skill_matches > 0:
             score += min(0.5, skill_matches * 0.1)
+        if exp_hit:
+            score += 0.2
+        return min(1.0, score)
+
+    def _match_features(self, job: Job) -> Tuple[bool, int, bool]:
+        """Return (title keyword hit, distinct skill matches, entry-level hit) for a job."""
+        # Check title match
+        title = job.title.lower()
+        if self._kw_automaton is not None:
+            title_hit = any(True for _ in self._kw_automaton.iter(title))
+        else:
+            title_hit = self._kw_re is not None and self._kw_re.search(title) is not None
+        if not title_hit and RAPIDFUZZ_AVAILABLE and title and self._kw_lower:
+            # Catch near misses such as "Java Dev" vs "Java Developer"
+            title_hit = process.extractOne(
+                title, self._kw_lower, scorer=fuzz.token_set_ratio,
+                score_cutoff=TITLE_FUZZY_CUTOFF
+            ) is not None
+
+        # Check skills match (each skill counts once, stop at the score cap)
+        description = ' '.join((job.description, job.requirements)).lower()
+        matched = set()
+        if self._skill_automaton is not None:
+            for _, index in self._skill_automaton.iter(description):
+                matched.add(index)
+                if len(matched) >= MAX_SKILL_MATCHES:
+                    break
+        else:
+            for index, skill in enumerate(self._skills_lower):
+                if skill in description:
+                    matched.add(index)
+                    if len(matched) >= MAX_SKILL_MATCHES:
+                        break
+
+        if RAPIDFUZZ_AVAILABLE and self._fuzzy_skills and len(matched) < MAX_SKILL_MATCHES:
+            # Fuzzy pass for typos and inflections: each remaining skill is
+            # compared with the description's words (or word n-grams for
+            # multi-word skills) rather than the whole text
+            words = _WORD_RE.findall(description)
+            grams_by_size: Dict[int, Set[str]] = {}
+            for index, skill, size in self._fuzzy_skills:
+                if index in matched:
+                    continue
+                grams = grams_by_size.get(size)
+                if grams is None:
+                    grams = grams_by_size[size] = {
+                        ' '.join(words[i:i + size]) for i in range(len(words) - size + 1)
+                    }
+                if grams and process.extractOne(
+                    skill, grams, scorer=fuzz.ratio, score_cutoff=SKILL_FUZZY_CUTOFF
+                ) is not None:
+                    matched.add(index)
+                    if len(matched) >= MAX_SKILL_MATCHES:
+                        break
 
         # Check experience requirements
-        exp_text = job.get('experience_required', '').lower()
-        if any(term in exp_text for term in ['0-2', '0 to 2', 'fresher', 'entry level']):
-            score += 0.2
+        exp_text = job.experience_required.lower()
+        exp_hit = any(term in exp_text for term in self._exp_terms)
 
-        return min(1.0, score)
+        return title_hit, len(matched), exp_hit
 
     async def _update_daily_stats(self):
         """Update daily statistics."""
@@ -234,8 +497,10 @@ class JobApplicationAgent:
 
     async def get_dashboard_data(self) -> Dict[str, Any]:
         """Get data for the dashboard."""
-        recent_jobs = await self.db.get_jobs(limit=10)
-        stats = await self.db.get_stats(days=7)
+        recent_jobs, stats = await asyncio.gather(
+            self.db.get_jobs(limit=10),
+            self.db.get_stats(days=7)
+        )
 
         return {
             'stats': self.stats,
@@ -6,12 +6,17 @@ import os
 import json
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from dotenv import load_dotenv
 
+from ..utils import json_codec
+
 # Load environment variables
 load_dotenv()
 
+# Resolved once per process; Config and anything else needing it reuse this
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
 @dataclass
 class UserProfile:
     """User profile configuration for job matching."""
@@ -33,6 +38,32 @@ class UserProfile:
         "HCL", "Tech Mahindra", "Capgemini", "Startups", "MNCs", "PSUs"
     ])
 
+@dataclass(frozen=True)
+class ProfileSnapshot:
+    """Immutable copy of the user profile, taken once at agent start."""
+    name: str
+    email: str
+    phone: str
+    education: str
+    experience_years: int
+    skills: Tuple[str, ...]
+    preferred_locations: Tuple[str, ...]
+    target_companies: Tuple[str, ...]
+
+    @classmethod
+    def from_profile(cls, profile: UserProfile) -> "ProfileSnapshot":
+        """Snapshot a (mutable) user profile."""
+        return cls(
+            name=profile.name,
+            email=profile.email,
+            phone=profile.phone,
+            education=profile.education,
+            experience_years=profile.experience_years,
+            skills=tuple(profile.skills),
+            preferred_locations=tuple(profile.preferred_locations),
+            target_companies=tuple(profile.target_companies)
+        )
+
 @dataclass
 class JobSearchConfig:
     """Job search and filtering configuration."""
@@ -46,6 +77,7 @@ class JobSearchConfig:
         "Senior", "Lead", "Manager", "Architect", "Principal"
     ])
     max_applications_per_day: int = 50
+    max_concurrent_applications: int = 3
     application_delay_min: int = 2
     application_delay_max: int = 5
 
@@ -75,6 +107,8 @@ class BrowserConfig:
     viewport_height: int = 768
     timeout: int = 30000
     slow_mo: int = 100
+    # Browser contexts open at once across all scrapers
+    max_scraper_workers: int = 4
 
 @dataclass
 class NotificationConfig:
@@ -90,7 +124,7 @@ class Config:
     """Main configuration class."""
 
     def __init__(self):
-        self.project_root = Path(__file__).resolve().parents[3]
+        self.project_root = PROJECT_ROOT
         self.data_dir = self.project_root / "data"
         self.config_dir = self.project_root / "config"
 
@@ -109,30 +143,33 @@ class Config:
         # Ensure data directories exist
         self._ensure_directories()
 
+    # Sections that can be overridden by JSON files in config_dir
+    _FILE_SECTIONS = ("user_profile", "job_search")
+
     def _load_from_files(self):
         """Load configuration from JSON files."""
         try:
-            # Load user profile if exists
-            profile_file = self.config_dir / "user_profile.json"
-            if profile_file.exists():
-                with open(profile_file) as f:
-                    profile_data = json.load(f)
-                    for key, value in profile_data.items():
-                        if hasattr(self.user_profile, key):
-                            setattr(self.user_profile, key, value)
-
-            # Load job search config if exists
-            job_config_file = self.config_dir / "job_search.json"
-            if job_config_file.exists():
-                with open(job_config_file) as f:
-                    job_data = json.load(f)
-                    for key, value in job_data.items():
-                        if hasattr(self.job_search, key):
-                            setattr(self.job_search, key, value)
+            for section, data in self._read_config_files().items():
+                target = getattr(self, section)
+                for key, value in data.items():
+                    if hasattr(target, key):
+                        setattr(target, key, value)
 
         except Exception as e:
             print(f"Warning: Could not load config files: {e}")
 
+    def _read_config_files(self) -> Dict[str, Dict[str, Any]]:
+        """Parse the per-section JSON files that exist."""
+        sections = {}
+        for section in self._FILE_SECTIONS:
+            # Opening directly saves a separate exists()/stat() per file
+            try:
+                with open(self.config_dir / f"{section}.json", "rb") as f:
+                    sections[section] = json_codec.loads(f.read())
+            except FileNotFoundError:
+                continue
+        return sections
+
     def _load_from_env(self):
         """Load configuration from environment variables."""
         # Database
@@ -170,10 +207,19 @@ class Config:
         if max_apps and max_apps.isdigit():
             self.job_search.max_applications_per_day = int(max_apps)
 
+        max_concurrent = os.environ.get("MAX_CONCURRENT_APPLICATIONS")
+        if max_concurrent and max_concurrent.isdigit():
+            self.job_search.max_concurrent_applications = int(max_concurrent)
+
         # Browser
         headless = os.environ.get("BROWSER_HEADLESS")
         if headless:
             self.browser.headless = headless.lower() == "true"
+
+        max_workers = os.environ.get("MAX_SCRAPER_WORKERS")
+        if max_workers and max_workers.isdigit():
+            self.browser.max_scraper_workers = int(max_workers)
+
     def _ensure_directories(self):
         """Ensure all required directories exist."""
         directories = [
@@ -7,15 +7,87 @@ import aiosqlite
 import asyncio
 import logging
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, AsyncIterator, Sequence, Tuple, Union
 from datetime import datetime, timedelta
-import json
+from contextlib import asynccontextmanager
 
 from .encryption import EncryptionManager
 from .config import config
+from ..models.job import Job
 
 logger = logging.getLogger(__name__)
 
+# Applied to every connection. WAL turns each commit into an append to the
+# write-ahead log instead of an fsync'd rollback journal, and lets readers
+# run alongside the writer. WAL needs shared memory, so the database file
+# must live on a local filesystem (not NFS/SMB).
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+# SQL used on the hot paths. Keeping each statement as one constant string
+# means the shared connection's statement cache always gets an exact hit.
+_SAVE_JOB_SQL = """
+    INSERT OR REPLACE INTO jobs
+    (job_id, title, company, location, description, requirements,
+     salary_range, experience_required, posted_date, source_platform,
+     source_url, match_score, status, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_RECENT_JOB_IDS_SQL = "SELECT job_id FROM jobs ORDER BY created_at DESC LIMIT ?"
+
+_GET_JOBS_SQL = "SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?"
+
+_GET_JOBS_BY_STATUS_SQL = "SELECT * FROM jobs WHERE status = ? ORDER BY created_at DESC LIMIT ?"
+
+_UPDATE_JOB_STATUS_SQL = "UPDATE jobs SET status = ?, updated_at = ? WHERE job_id = ?"
+
+_SAVE_APPLICATION_SQL = """
+    INSERT INTO applications
+    (job_id, application_id, status, cover_letter_path, notes)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_UPDATE_APPLICATION_SQL = """
+    UPDATE applications
+    SET status = ?, response_status = ?, response_received_at = ?
+    WHERE application_id = ?
+"""
+
+_JOB_STATS_SQL = """
+    SELECT COUNT(*) as total_jobs,
+           SUM(CASE WHEN status = 'applied' THEN 1 ELSE 0 END) as applied_jobs,
+           SUM(CASE WHEN status = 'discovered' THEN 1 ELSE 0 END) as pending_jobs
+    FROM jobs
+    WHERE created_at >= ?
+"""
+
+_APP_STATS_SQL = """
+    SELECT COUNT(*) as total_applications,
+           SUM(CASE WHEN status = 'submitted' THEN 1 ELSE 0 END) as submitted_applications,
+           SUM(CASE WHEN response_status = 'accepted' THEN 1 ELSE 0 END) as accepted_applications
+    FROM applications
+    WHERE applied_at >= ?
+"""
+
+_UPDATE_DAILY_STATS_SQL = """
+    INSERT OR REPLACE INTO daily_stats
+    (date, jobs_found, applications_sent)
+    VALUES (?, ?, ?)
+"""
+
+_SAVE_CREDENTIALS_SQL = """
+    INSERT OR REPLACE INTO user_credentials
+    (platform, username_encrypted, password_encrypted, additional_data_encrypted, updated_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_GET_CREDENTIALS_SQL = "SELECT * FROM user_credentials WHERE platform = ?"
+
 class Database:
     """Database manager with encryption support."""
 
@@ -24,12 +96,69 @@ class Database:
         self.encryption_manager = EncryptionManager(config.database.encryption_key) if config.database.encryption_key else None
         self._ensure_db_exists()
 
+        # Shared connection, opened by connect() or on first use. The locks are
+        # created lazily so they bind to the running event loop.
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+
+    async def connect(self):
+        """Open the shared connection used by all database operations."""
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+            self._write_lock = asyncio.Lock()
+
+        async with self._connect_lock:
+            if self._conn is not None:
+                return
+
+            conn = await aiosqlite.connect(self.db_path)
+            conn.row_factory = aiosqlite.Row
+            for pragma in _PRAGMAS:
+                await conn.execute(pragma)
+            self._conn = conn
+            logger.info("Database connection opened")
+
+    async def close(self):
+        """Close the shared connection."""
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+            logger.info("Database connection closed")
+
+    async def _get_conn(self) -> aiosqlite.Connection:
+        """Return the shared connection, opening it if needed."""
+        if self._conn is None:
+            await self.connect()
+        assert self._conn is not None
+        return self._conn
+
+    @asynccontextmanager
+    async def _read(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Use the shared connection for reads."""
+        yield await self._get_conn()
+
+    @asynccontextmanager
+    async def _write(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Use the shared connection for one committed write transaction."""
+        conn = await self._get_conn()
+        assert self._write_lock is not None
+        async with self._write_lock:
+            try:
+                yield conn
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+
     def _ensure_db_exists(self):
         """Ensure database file and directory exist."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Create tables if they don't exist
         with sqlite3.connect(self.db_path) as conn:
+            for pragma in _PRAGMAS:
+                conn.execute(pragma)
             self._create_tables(conn)
 
     def _create_tables(self, conn: sqlite3.Connection):
@@ -87,59 +216,79 @@ class Database:
             )
         """)
 
+        # Indexes for the status/date filters used by get_jobs, get_stats and
+        # update_application
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs(status, created_at DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at DESC)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_apps_applied_at ON applications(applied_at)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_apps_application_id ON applications(application_id)")
+
         conn.commit()
         logger.info("Database tables created/verified")
 
     async def save_job(self, job_data: Dict[str, Any]) -> bool:
         """Save job information to database."""
+        return await self.save_jobs([job_data])
+
+    async def save_jobs(self, jobs: Sequence[Union[Job, Dict[str, Any]]]) -> bool:
+        """Save several jobs in a single transaction."""
+        if not jobs:
+            return True
+
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    INSERT OR REPLACE INTO jobs 
-                    (job_id, title, company, location, description, requirements, 
-                     salary_range, experience_required, posted_date, source_platform, 
-                     source_url, match_score, status, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    job_data.get('job_id'),
-                    job_data.get('title'),
-                    job_data.get('company'),
-                    job_data.get('location'),
-                    job_data.get('description'),
-                    job_data.get('requirements'),
-                    job_data.get('salary_range'),
-                    job_data.get('experience_required'),
-                    job_data.get('posted_date'),
-                    job_data.get('source_platform'),
-                    job_data.get('source_url'),
-                    job_data.get('match_score', 0.0),
-                    job_data.get('status', 'discovered'),
-                    datetime.now().isoformat()
-                ))
-                await db.commit()
+            updated_at = datetime.now().isoformat()
+            rows = [
+                job.as_row(updated_at) if isinstance(job, Job) else self._job_row(job, updated_at)
+                for job in jobs
+            ]
+
+            async with self._write() as db:
+                await db.executemany(_SAVE_JOB_SQL, rows)
                 return True
         except Exception as e:
-            logger.error(f"Failed to save job: {e}")
+            logger.error(f"Failed to save jobs: {e}")
             return False
 
+    @staticmethod
+    def _job_row(job_data: Dict[str, Any], updated_at: str) -> tuple:
+        """Build the jobs table parameter tuple for a job."""
+        return (
+            job_data.get('job_id'),
+            job_data.get('title'),
+            job_data.get('company'),
+            job_data.get('location'),
+            job_data.get('description'),
+            job_data.get('requirements'),
+            job_data.get('salary_range'),
+            job_data.get('experience_required'),
+            job_data.get('posted_date'),
+            job_data.get('source_platform'),
+            job_data.get('source_url'),
+            job_data.get('match_score', 0.0),
+            job_data.get('status', 'discovered'),
+            updated_at
+        )
+
+    async def get_recent_job_ids(self, limit: int) -> List[str]:
+        """Get the ids of the most recently created jobs, newest first."""
+        try:
+            async with self._read() as db:
+                rows = await db.execute_fetchall(_RECENT_JOB_IDS_SQL, (limit,))
+                return [row['job_id'] for row in rows]
+
+        except Exception as e:
+            logger.error(f"Failed to get recent job ids: {e}")
+            return []
+
     async def get_jobs(self, status: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
         """Get jobs from database with optional status filter."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                query = "SELECT * FROM jobs"
-                params = []
-                
+            async with self._read() as db:
                 if status:
-                    query += " WHERE status = ?"
-                    params.append(status)
-                
-                query += " ORDER BY created_at DESC LIMIT ?"
-                params.append(limit)
-
-                async with db.execute(query, params) as cursor:
-                    rows = await cursor.fetchall()
-                    return [dict(row) for row in rows]
+                    rows = await db.execute_fetchall(_GET_JOBS_BY_STATUS_SQL, (status, limit))
+                else:
+                    rows = await db.execute_fetchall(_GET_JOBS_SQL, (limit,))
+                return [dict(row) for row in rows]
 
         except Exception as e:
             logger.error(f"Failed to get jobs: {e}")
@@ -148,34 +297,51 @@ class Database:
     async def save_application(self, application_data: Dict[str, Any]) -> bool:
         """Save application information to database."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    INSERT INTO applications 
-                    (job_id, application_id, status, cover_letter_path, notes)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    application_data.get('job_id'),
-                    application_data.get('application_id'),
-                    application_data.get('status', 'pending'),
-                    application_data.get('cover_letter_path'),
-                    application_data.get('notes')
-                ))
-                await db.commit()
+            async with self._write() as db:
+                await db.execute(_SAVE_APPLICATION_SQL, self._application_row(application_data))
                 return True
         except Exception as e:
             logger.error(f"Failed to save application: {e}")
             return False
 
+    @staticmethod
+    def _application_row(application_data: Dict[str, Any]) -> tuple:
+        """Build the applications table parameter tuple for an application."""
+        return (
+            application_data.get('job_id'),
+            application_data.get('application_id'),
+            application_data.get('status', 'pending'),
+            application_data.get('cover_letter_path'),
+            application_data.get('notes')
+        )
+
+    async def save_application_results(self, status_updates: Sequence[Tuple[str, str]],
+                                       applications: Sequence[Dict[str, Any]]) -> bool:
+        """Save job status changes and application records in one transaction.
+
+        status_updates holds (job_id, status) pairs.
+        """
+        try:
+            updated_at = datetime.now().isoformat()
+            async with self._write() as db:
+                if status_updates:
+                    await db.executemany(_UPDATE_JOB_STATUS_SQL, [
+                        (status, updated_at, job_id) for job_id, status in status_updates
+                    ])
+                if applications:
+                    await db.executemany(_SAVE_APPLICATION_SQL, [
+                        self._application_row(application_data) for application_data in applications
+                    ])
+                return True
+        except Exception as e:
+            logger.error(f"Failed to save application results: {e}")
+            return False
+
     async def update_application(self, application_id: str, status: str, response_status: Optional[str] = None) -> bool:
         """Update application status and response."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    UPDATE applications 
-                    SET status = ?, response_status = ?, response_received_at = ?
-                    WHERE application_id = ?
-                """, (status, response_status, datetime.now().isoformat(), application_id))
-                await db.commit()
+            async with self._write() as db:
+                await db.execute(_UPDATE_APPLICATION_SQL, (status, response_status, datetime.now().isoformat(), application_id))
                 return True
         except Exception as e:
             logger.error(f"Failed to update application: {e}")
@@ -184,31 +350,16 @@ class Database:
     async def get_stats(self, days: int = 7) -> Dict[str, Any]:
         """Get application statistics for the specified number of days."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
+            async with self._read() as db:
                 date_limit = (datetime.now() - timedelta(days=days)).isoformat()
 
-                # Get job stats
-                async with db.execute("""
-                    SELECT COUNT(*) as total_jobs,
-                           SUM(CASE WHEN status = 'applied' THEN 1 ELSE 0 END) as applied_jobs,
-                           SUM(CASE WHEN status = 'discovered' THEN 1 ELSE 0 END) as pending_jobs
-                    FROM jobs
-                    WHERE created_at >= ?
-                """, (date_limit,)) as cursor:
-                    job_stats_row = await cursor.fetchone()
-                    job_stats = {str(k): v for k, v in dict(job_stats_row).items()} if job_stats_row else {}
-
-                # Get application stats
-                async with db.execute("""
-                    SELECT COUNT(*) as total_applications,
-                           SUM(CASE WHEN status = 'submitted' THEN 1 ELSE 0 END) as submitted_applications,
-                           SUM(CASE WHEN response_status = 'accepted' THEN 1 ELSE 0 END) as accepted_applications
-                    FROM applications
-                    WHERE applied_at >= ?
-                """, (date_limit,)) as cursor:
-                    app_stats_row = await cursor.fetchone()
-                    app_stats = {str(k): v for k, v in dict(app_stats_row).items()} if app_stats_row else {}
+                # Job and application stats are independent; issue both at once
+                job_rows, app_rows = await asyncio.gather(
+                    db.execute_fetchall(_JOB_STATS_SQL, (date_limit,)),
+                    db.execute_fetchall(_APP_STATS_SQL, (date_limit,))
+                )
+                job_stats = {str(k): v for k, v in dict(job_rows[0]).items()} if job_rows else {}
+                app_stats = {str(k): v for k, v in dict(app_rows[0]).items()} if app_rows else {}
 
                 return {**job_stats, **app_stats}
 
@@ -220,13 +371,8 @@ class Database:
         """Update daily statistics."""
         today = datetime.now().date().isoformat()
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    INSERT OR REPLACE INTO daily_stats 
-                    (date, jobs_found, applications_sent)
-                    VALUES (?, ?, ?)
-                """, (today, jobs_found, applications_sent))
-                await db.commit()
+            async with self._write() as db:
+                await db.execute(_UPDATE_DAILY_STATS_SQL, (today, jobs_found, applications_sent))
         except Exception as e:
             logger.error(f"Failed to update daily stats: {e}")
 
@@ -242,23 +388,18 @@ class Database:
             username_encrypted = self.encryption_manager.encrypt_string(username)
             password_encrypted = self.encryption_manager.encrypt_string(password)
             additional_data_encrypted = (
-                self.encryption_manager.encrypt_string(json.dumps(additional_data))
+                self.encryption_manager.encrypt_dict(additional_data)
                 if additional_data else None
             )
 
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    INSERT OR REPLACE INTO user_credentials 
-                    (platform, username_encrypted, password_encrypted, additional_data_encrypted, updated_at)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
+            async with self._write() as db:
+                await db.execute(_SAVE_CREDENTIALS_SQL, (
                     platform,
                     username_encrypted,
                     password_encrypted,
                     additional_data_encrypted,
                     datetime.now().isoformat()
                 ))
-                await db.commit()
                 return True
         except Exception as e:
             logger.error(f"Failed to save credentials: {e}")
@@ -271,26 +412,21 @@ class Database:
             return None
 
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                async with db.execute(
-                    "SELECT * FROM user_credentials WHERE platform = ?",
-                    (platform,)
-                ) as cursor:
-                    row = await cursor.fetchone()
-                    if not row:
-                        return None
-
-                    result = {
-                        'username': self.encryption_manager.decrypt_string(row['username_encrypted']),
-                        'password': self.encryption_manager.decrypt_string(row['password_encrypted'])
-                    }
-
-                    if row['additional_data_encrypted']:
-                        additional_data = self.encryption_manager.decrypt_string(row['additional_data_encrypted'])
-                        result['additional_data'] = json.loads(additional_data)
-
-                    return result
+            async with self._read() as db:
+                rows = await db.execute_fetchall(_GET_CREDENTIALS_SQL, (platform,))
+                if not rows:
+                    return None
+                row = rows[0]
+
+                result = {
+                    'username': self.encryption_manager.decrypt_string(row['username_encrypted']),
+                    'password': self.encryption_manager.decrypt_string(row['password_encrypted'])
+                }
+
+                if row['additional_data_encrypted']:
+                    result['additional_data'] = self.encryption_manager.decrypt_dict(row['additional_data_encrypted'])
+
+                return result
 
         except Exception as e:
             logger.error(f"Failed to get credentials: {e}")
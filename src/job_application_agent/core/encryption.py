@@ -4,24 +4,77 @@ Encryption utilities for secure local data storage.
 
 import os
 import base64
+import hashlib
+import struct
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from typing import Union, Optional
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from typing import BinaryIO, Union, Optional
 import logging
 
+from ..utils import json_codec
+from ._threads import to_thread_fast
+
 logger = logging.getLogger(__name__)
 
+# Ciphertexts produced with AES-GCM start with this version byte. Fernet
+# tokens are base64 text (always starting with b"g"), so the two formats
+# can't be confused and old data keeps decrypting.
+_AESGCM_VERSION = b"\x01"
+_NONCE_SIZE = 12
+_HKDF_INFO = b"job-application-agent aes-gcm v1"
+
+# SecureStorage files are written as a sequence of independently sealed
+# AES-GCM chunks: magic, then per chunk a 4-byte length, nonce and ciphertext.
+# The chunk index and a "last chunk" flag are bound in as associated data so
+# reordered or truncated files fail to decrypt.
+_CHUNKED_MAGIC = b"JSA\x02"
+_CHUNK_HEADER = struct.Struct(">I")
+_CHUNK_AAD = struct.Struct(">I?")
+STREAM_CHUNK_SIZE = 64 * 1024
+
+PBKDF2_ITERATIONS = 100_000
+# scrypt cost parameters for from_password_scrypt (~32 MiB of memory)
+SCRYPT_N = 2 ** 15
+SCRYPT_R = 8
+SCRYPT_P = 1
+
 class EncryptionManager:
     """Handles encryption and decryption of sensitive data."""
 
-    def __init__(self, key: Optional[Union[str, bytes]] = None):
-        """Initialize encryption manager with a key."""
+    def __init__(self, key: Optional[Union[str, bytes]] = None, legacy_fernet: bool = False):
+        """
+        Initialize encryption manager with a (Fernet format) key.
+
+        New data is encrypted with AES-256-GCM under a key derived from it;
+        Fernet is kept to decrypt existing data, and to encrypt when
+        legacy_fernet is set.
+        """
         if key:
-            self.fernet = Fernet(key.encode() if isinstance(key, str) else key)
+            key_bytes = key.encode() if isinstance(key, str) else key
         else:
             # Generate a new key if none provided
-            self.fernet = Fernet(Fernet.generate_key())
+            key_bytes = Fernet.generate_key()
+
+        self.fernet = Fernet(key_bytes)
+        self.legacy_fernet = legacy_fernet
+
+        aead_key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=_HKDF_INFO,
+        ).derive(base64.urlsafe_b64decode(key_bytes))
+        # Built once per manager: the AESGCM object keeps the initialised key
+        # context between calls. A lower-level Cipher(AES, GCM(nonce)) context
+        # is single-use per nonce and measured ~5x slower for short payloads.
+        self._aead = AESGCM(aead_key)
+
+    @classmethod
+    def from_fernet_key(cls, key: Union[str, bytes]) -> "EncryptionManager":
+        """Create a manager that still writes Fernet tokens (for older readers)."""
+        return cls(key, legacy_fernet=True)
 
     @classmethod
     def from_password(cls, password: str, salt: Optional[bytes] = None) -> "EncryptionManager":
@@ -29,58 +82,160 @@ class EncryptionManager:
         if salt is None:
             salt = os.urandom(16)
 
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
+        # Same derivation as before, computed directly by OpenSSL
+        raw_key = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, PBKDF2_ITERATIONS, dklen=32)
+        return cls(base64.urlsafe_b64encode(raw_key))
+
+    @classmethod
+    async def from_password_async(cls, password: str, salt: Optional[bytes] = None) -> "EncryptionManager":
+        """Like from_password, but derives the key in a worker thread.
+
+        pbkdf2_hmac releases the GIL, so the event loop keeps running during
+        the ~100 ms derivation.
+        """
+        if salt is None:
+            salt = os.urandom(16)
+
+        raw_key = await to_thread_fast(
+            hashlib.pbkdf2_hmac, 'sha256', password.encode(), salt, PBKDF2_ITERATIONS, 32
         )
-        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-        return cls(key)
+        return cls(base64.urlsafe_b64encode(raw_key))
 
-    def encrypt_string(self, data: str) -> bytes:
-        """Encrypt a string and return bytes."""
-        if not data:
+    @classmethod
+    def from_password_scrypt(cls, password: str, salt: Optional[bytes] = None) -> "EncryptionManager":
+        """Create encryption manager from a password using scrypt (for new setups)."""
+        if salt is None:
+            salt = os.urandom(16)
+
+        raw_key = hashlib.scrypt(
+            password.encode(), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P,
+            maxmem=2 * 128 * SCRYPT_N * SCRYPT_R, dklen=32
+        )
+        return cls(base64.urlsafe_b64encode(raw_key))
+
+    def encrypt_bytes(self, plaintext: bytes) -> bytes:
+        """Encrypt raw bytes."""
+        if not plaintext:
             return b""
         try:
-            return self.fernet.encrypt(data.encode('utf-8'))
+            if self.legacy_fernet:
+                return self.fernet.encrypt(plaintext)
+
+            nonce = os.urandom(_NONCE_SIZE)
+            return _AESGCM_VERSION + nonce + self._aead.encrypt(nonce, plaintext, None)
         except Exception as e:
             logger.error(f"Encryption failed: {e}")
             raise
 
-    def decrypt_string(self, encrypted_data: bytes) -> str:
-        """Decrypt bytes and return a string."""
+    def decrypt_bytes(self, encrypted_data: bytes) -> bytes:
+        """Decrypt to raw bytes."""
         if not encrypted_data:
-            return ""
+            return b""
         try:
-            return self.fernet.decrypt(encrypted_data).decode('utf-8')
+            if encrypted_data[:1] == _AESGCM_VERSION:
+                nonce = encrypted_data[1:1 + _NONCE_SIZE]
+                return self._aead.decrypt(nonce, encrypted_data[1 + _NONCE_SIZE:], None)
+            # Data written before the switch to AES-GCM
+            return self.fernet.decrypt(encrypted_data)
         except Exception as e:
             logger.error(f"Decryption failed: {e}")
             raise
 
+    def encrypt_to_file(self, plaintext: bytes, f: BinaryIO) -> None:
+        """Encrypt plaintext into f in STREAM_CHUNK_SIZE chunks.
+
+        Only the ciphertext is streamed: one chunk of it is held at a time,
+        but the caller still passes the whole serialized plaintext, so peak
+        memory stays proportional to the payload.
+        """
+        if self.legacy_fernet:
+            f.write(self.fernet.encrypt(plaintext))
+            return
+
+        view = memoryview(plaintext)
+        total = len(view)
+        f.write(_CHUNKED_MAGIC)
+        index = 0
+        offset = 0
+        while True:
+            chunk = view[offset:offset + STREAM_CHUNK_SIZE]
+            offset += STREAM_CHUNK_SIZE
+            is_last = offset >= total
+            nonce = os.urandom(_NONCE_SIZE)
+            ciphertext = self._aead.encrypt(nonce, bytes(chunk), _CHUNK_AAD.pack(index, is_last))
+            f.write(_CHUNK_HEADER.pack(len(ciphertext)))
+            f.write(nonce)
+            f.write(ciphertext)
+            if is_last:
+                break
+            index += 1
+
+    def decrypt_from_file(self, f: BinaryIO) -> bytes:
+        """Decrypt data written by encrypt_to_file (or a single legacy token).
+
+        Chunks are read and authenticated one at a time, but the plaintext is
+        collected in full before it is returned for parsing.
+        """
+        magic = f.read(len(_CHUNKED_MAGIC))
+        if magic != _CHUNKED_MAGIC:
+            # Whole-file AES-GCM or Fernet token from older versions
+            return self.decrypt_bytes(magic + f.read())
+
+        plaintext = bytearray()
+        index = 0
+        header = f.read(_CHUNK_HEADER.size)
+        while True:
+            if len(header) < _CHUNK_HEADER.size:
+                raise ValueError("Encrypted file is truncated")
+            (length,) = _CHUNK_HEADER.unpack(header)
+            nonce = f.read(_NONCE_SIZE)
+            ciphertext = f.read(length)
+            if len(nonce) < _NONCE_SIZE or len(ciphertext) < length:
+                raise ValueError("Encrypted file is truncated")
+
+            # Read ahead to learn whether this is the final chunk
+            header = f.read(_CHUNK_HEADER.size)
+            is_last = not header
+            plaintext += self._aead.decrypt(nonce, ciphertext, _CHUNK_AAD.pack(index, is_last))
+            if is_last:
+                return bytes(plaintext)
+            index += 1
+
+    def encrypt_string(self, data: str) -> bytes:
+        """Encrypt a string and return bytes."""
+        if not data:
+            return b""
+        return self.encrypt_bytes(data.encode('utf-8'))
+
+    def decrypt_string(self, encrypted_data: bytes) -> str:
+        """Decrypt bytes and return a string."""
+        return self.decrypt_bytes(encrypted_data).decode('utf-8')
+
     def encrypt_dict(self, data: dict) -> bytes:
         """Encrypt a dictionary as JSON."""
-        import json
-        json_str = json.dumps(data, ensure_ascii=False)
-        return self.encrypt_string(json_str)
+        return self.encrypt_bytes(json_codec.dumps(data))
 
     def decrypt_dict(self, encrypted_data: bytes) -> dict:
         """Decrypt bytes and return a dictionary."""
-        import json
-        json_str = self.decrypt_string(encrypted_data)
-        return json.loads(json_str) if json_str else {}
+        plaintext = self.decrypt_bytes(encrypted_data)
+        return json_codec.loads(plaintext) if plaintext else {}
 
     def get_key(self) -> bytes:
         """Get the encryption key."""
         # This is for backup purposes only - handle with care
         return self.fernet._signing_key + self.fernet._encryption_key
 
+# fdatasync skips flushing file metadata; not available on macOS/Windows
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
+
 class SecureStorage:
     """Wrapper for secure file-based storage."""
 
     def __init__(self, file_path: str, encryption_key: str):
         self.file_path = file_path
         self.encryption_manager = EncryptionManager(encryption_key)
+        # Digest of the plaintext currently on disk, to skip redundant saves
+        self._last_plaintext_hash: Optional[bytes] = None
 
         # Ensure parent directory exists
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
@@ -88,9 +243,21 @@ class SecureStorage:
     def save(self, data: dict) -> bool:
         """Save encrypted data to file."""
         try:
-            encrypted_data = self.encryption_manager.encrypt_dict(data)
-            with open(self.file_path, 'wb') as f:
-                f.write(encrypted_data)
+            plaintext = json_codec.dumps(data)
+            digest = hashlib.blake2b(plaintext, digest_size=16).digest()
+            if digest == self._last_plaintext_hash and os.path.exists(self.file_path):
+                return True
+
+            # Write to a temp file and swap it in so a crash never leaves a
+            # truncated file behind
+            tmp_path = self.file_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                self.encryption_manager.encrypt_to_file(plaintext, f)
+                f.flush()
+                _fdatasync(f.fileno())
+            os.replace(tmp_path, self.file_path)
+
+            self._last_plaintext_hash = digest
             return True
         except Exception as e:
             logger.error(f"Failed to save secure data: {e}")
@@ -103,12 +270,10 @@ class SecureStorage:
                 return {}
 
             with open(self.file_path, 'rb') as f:
-                encrypted_data = f.read()
-
-            if not encrypted_data:
-                return {}
+                plaintext = self.encryption_manager.decrypt_from_file(f)
 
-            return self.encryption_manager.decrypt_dict(encrypted_data)
+            self._last_plaintext_hash = hashlib.blake2b(plaintext, digest_size=16).digest()
+            return json_codec.loads(plaintext) if plaintext else {}
         except Exception as e:
             logger.error(f"Failed to load secure data: {e}")
             return {}
@@ -122,6 +287,7 @@ class SecureStorage:
         try:
             if os.path.exists(self.file_path):
                 os.remove(self.file_path)
+            self._last_plaintext_hash = None
             return True
         except Exception as e:
             logger.error(f"Failed to delete secure file: {e}")
@@ -3,9 +3,11 @@ Desktop notification system for the job application agent.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Deque
 import asyncio
+from collections import deque
 from datetime import datetime
+from itertools import islice
 
 try:
     from plyer import notification as plyer_notification
@@ -16,13 +18,17 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Number of notifications kept in memory
+HISTORY_SIZE = 100
+
 class NotificationManager:
     """Manages desktop notifications and alerts."""
 
     def __init__(self) -> None:
         """Initialize notification manager."""
         self.enabled = PLYER_AVAILABLE
-        self.notification_history: List[Dict[str, Any]] = []
+        # Oldest entries drop off automatically once HISTORY_SIZE is reached
+        self.notification_history: Deque[Dict[str, Any]] = deque(maxlen=HISTORY_SIZE)
 
     async def send_notification(
         self, 
@@ -63,10 +69,6 @@ class NotificationManager:
                 'timestamp': datetime.now().isoformat()
             })
 
-            # Keep only last 100 notifications
-            if len(self.notification_history) > 100:
-                self.notification_history = self.notification_history[-100:]
-
             logger.info(f"Notification sent: {title}")
 
         except Exception as e:
@@ -82,7 +84,8 @@ class NotificationManager:
         Returns:
             List of recent notifications
         """
-        return self.notification_history[-limit:]
+        start = max(0, len(self.notification_history) - limit)
+        return list(islice(self.notification_history, start, None))
 
     def clear_history(self) -> None:
         """Clear all notification history."""
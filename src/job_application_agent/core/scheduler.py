@@ -3,9 +3,11 @@ Task scheduling system for the job application agent.
 """
 
 import asyncio
+import heapq
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Callable, Any
+from typing import Dict, Callable, Any, List, Optional, Tuple
 import schedule
 
 logger = logging.getLogger(__name__)
@@ -16,17 +18,27 @@ class JobScheduler:
     def __init__(self):
         self.tasks = {}
         self.running_tasks = set()
+        # Min-heap of (next_run, task_id); entries whose time no longer matches
+        # self.tasks (the task was rescheduled) are skipped when popped
+        self._heap: List[Tuple[float, str]] = []
+        # Created lazily so it binds to the running event loop
+        self._wakeup: Optional[asyncio.Event] = None
+        # (monotonic time built, payload) for get_task_status
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
 
     def schedule_periodic_task(self, task_id: str, task_func: Callable, interval_minutes: int):
         """Schedule a task to run periodically."""
         self.tasks[task_id] = {
             'func': task_func,
             'type': 'periodic',
-            'interval': interval_minutes,
-            'next_run': datetime.now() + timedelta(minutes=interval_minutes),
-            'last_run': None
+            'interval': interval_minutes * 60,  # seconds
+            'last_run': None,
+            'last_run_iso': None
         }
+        self._set_next_run(task_id, time.monotonic() + interval_minutes * 60)
+        self._push(task_id)
         logger.info(f"Scheduled periodic task '{task_id}' every {interval_minutes} minutes")
+        self.wake()
 
     def schedule_daily_task(self, task_id: str, task_func: Callable, hour: int, minute: int = 0):
         """Schedule a task to run daily at a specific time."""
@@ -41,56 +53,137 @@ class JobScheduler:
             'type': 'daily',
             'hour': hour,
             'minute': minute,
-            'next_run': next_run,
-            'last_run': None
+            'last_run': None,
+            'last_run_iso': None
         }
+        # Wall-clock target translated onto the monotonic clock
+        self._set_next_run(task_id, time.monotonic() + (next_run.timestamp() - time.time()))
+        self._push(task_id)
         logger.info(f"Scheduled daily task '{task_id}' at {hour:02d}:{minute:02d}")
+        self.wake()
+
+    def _set_next_run(self, task_id: str, next_run: float):
+        """Set a task's next_run, formatting its wall-clock ISO form once."""
+        task_info = self.tasks[task_id]
+        task_info['next_run'] = next_run
+        task_info['next_run_iso'] = datetime.fromtimestamp(
+            time.time() + (next_run - time.monotonic())
+        ).isoformat()
+        self._status_cache = None
+
+    def _push(self, task_id: str):
+        """Queue a task on the heap at its current next_run."""
+        heapq.heappush(self._heap, (self.tasks[task_id]['next_run'], task_id))
+
+    def _is_stale(self, entry: Tuple[float, str]) -> bool:
+        """Whether a heap entry refers to a removed or rescheduled task."""
+        next_run, task_id = entry
+        task_info = self.tasks.get(task_id)
+        return task_info is None or task_info['next_run'] != next_run
+
+    def _peek(self) -> Optional[Tuple[float, str]]:
+        """Earliest live heap entry, discarding stale ones on the way."""
+        heap = self._heap
+        while heap and self._is_stale(heap[0]):
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def wake(self):
+        """Wake up anyone waiting in wait_until_next()."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def seconds_until_next(self) -> float:
+        """Seconds until the next task is due (0 if one is due now)."""
+        entry = self._peek()
+        if entry is None:
+            return float('inf')
+        return max(0.0, entry[0] - time.monotonic())
+
+    async def wait_until_next(self, max_wait: float):
+        """Sleep until the next task is due, at most max_wait seconds.
+
+        Returns early if a task is scheduled or wake() is called meanwhile.
+        """
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        self._wakeup.clear()
+
+        timeout = min(self.seconds_until_next(), max_wait)
+        if timeout <= 0:
+            return
+
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
 
     async def process_tasks(self):
         """Process all scheduled tasks."""
-        now = datetime.now()
+        now = time.monotonic()
+        wall_now = time.time()
+
+        while True:
+            entry = self._peek()
+            if entry is None or entry[0] > now:
+                break
 
-        for task_id, task_info in self.tasks.items():
+            heapq.heappop(self._heap)
+            task_id = entry[1]
             if task_id in self.running_tasks:
-                continue  # Task is already running
+                continue  # Task is already running; it re-queues itself when done
 
-            if now >= task_info['next_run']:
-                logger.info(f"Executing scheduled task: {task_id}")
-                self.running_tasks.add(task_id)
+            task_info = self.tasks[task_id]
+            logger.info(f"Executing scheduled task: {task_id}")
+            self.running_tasks.add(task_id)
+            self._status_cache = None
 
-                try:
-                    # Run the task
-                    await task_info['func']()
-                    task_info['last_run'] = now
+            try:
+                # Run the task
+                await task_info['func']()
+                task_info['last_run'] = wall_now
+                task_info['last_run_iso'] = datetime.fromtimestamp(wall_now).isoformat()
 
-                    # Schedule next run
-                    if task_info['type'] == 'periodic':
-                        task_info['next_run'] = now + timedelta(minutes=task_info['interval'])
-                    elif task_info['type'] == 'daily':
-                        task_info['next_run'] = now + timedelta(days=1)
+                # Schedule next run
+                if task_info['type'] == 'periodic':
+                    self._set_next_run(task_id, now + task_info['interval'])
+                elif task_info['type'] == 'daily':
+                    self._set_next_run(task_id, now + 86400)
 
-                    logger.info(f"Task '{task_id}' completed successfully")
+                logger.info(f"Task '{task_id}' completed successfully")
 
-                except Exception as e:
-                    logger.error(f"Task '{task_id}' failed: {e}")
-                    # Schedule retry in 5 minutes
-                    task_info['next_run'] = now + timedelta(minutes=5)
+            except Exception as e:
+                logger.error(f"Task '{task_id}' failed: {e}")
+                # Schedule retry in 5 minutes
+                self._set_next_run(task_id, now + 300)
 
-                finally:
-                    self.running_tasks.discard(task_id)
+            finally:
+                self.running_tasks.discard(task_id)
+                self._status_cache = None
+                self._push(task_id)
 
     def get_task_status(self) -> Dict[str, Any]:
-        """Get status of all scheduled tasks."""
-        now = datetime.now()
-        status = {}
-
-        for task_id, task_info in self.tasks.items():
-            status[task_id] = {
+        """Get status of all scheduled tasks.
+
+        The result is reused for up to a second unless a task is scheduled,
+        starts or finishes in the meantime.
+        """
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached is not None and now - cached[0] < 1.0:
+            return cached[1]
+
+        running = self.running_tasks
+        status = {
+            task_id: {
                 'type': task_info['type'],
-                'next_run': task_info['next_run'].isoformat(),
-                'last_run': task_info['last_run'].isoformat() if task_info['last_run'] else None,
-                'is_running': task_id in self.running_tasks,
-                'time_until_next_run': str(task_info['next_run'] - now)
+                'next_run': task_info['next_run_iso'],
+                'last_run': task_info['last_run_iso'],
+                'is_running': task_id in running,
+                'time_until_next_run': str(timedelta(seconds=task_info['next_run'] - now))
             }
+            for task_id, task_info in self.tasks.items()
+        }
 
+        self._status_cache = (now, status)
         return status
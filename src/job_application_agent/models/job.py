@@ -2,11 +2,24 @@
 Job data model for the application.
 """
 
+import operator
+import sys
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
-@dataclass
+# slots=True drops the per-instance __dict__; dataclasses only accept it on 3.10+
+_DATACLASS_OPTIONS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Plain (non-datetime) Job fields in to_dict order, read with one attrgetter call
+_JOB_FIELDS = (
+    'job_id', 'title', 'company', 'location', 'description', 'requirements',
+    'salary_range', 'experience_required', 'posted_date', 'source_platform',
+    'source_url', 'match_score', 'status'
+)
+_JOB_GETTER = operator.attrgetter(*_JOB_FIELDS)
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Job:
     """Job data model."""
     job_id: str
@@ -22,40 +35,45 @@ class Job:
     posted_date: str = ""
     match_score: float = 0.0
     status: str = "discovered"  # discovered, applied, rejected, interview, offer
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
-
-    def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.now()
-        if self.updated_at is None:
-            self.updated_at = datetime.now()
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for database storage."""
-        return {
-            'job_id': self.job_id,
-            'title': self.title,
-            'company': self.company,
-            'location': self.location,
-            'description': self.description,
-            'requirements': self.requirements,
-            'salary_range': self.salary_range,
-            'experience_required': self.experience_required,
-            'posted_date': self.posted_date,
-            'source_platform': self.source_platform,
-            'source_url': self.source_url,
-            'match_score': self.match_score,
-            'status': self.status,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        data = dict(zip(_JOB_FIELDS, _JOB_GETTER(self)))
+        data['created_at'] = self.created_at.isoformat() if self.created_at else None
+        data['updated_at'] = self.updated_at.isoformat() if self.updated_at else None
+        return data
+
+    def as_row(self, updated_at: str) -> tuple:
+        """Build the jobs table parameter tuple used by Database.save_jobs."""
+        return (
+            self.job_id,
+            self.title,
+            self.company,
+            self.location,
+            self.description,
+            self.requirements,
+            self.salary_range,
+            self.experience_required,
+            self.posted_date,
+            self.source_platform,
+            self.source_url,
+            self.match_score,
+            self.status,
+            updated_at
+        )
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Job":
         """Create Job instance from dictionary."""
-        created_at = datetime.fromisoformat(data['created_at']) if data.get('created_at') else None
-        updated_at = datetime.fromisoformat(data['updated_at']) if data.get('updated_at') else None
+        # Timestamps are only passed when present, so the default_factory
+        # runs just for the ones that are missing
+        timestamps = {}
+        if data.get('created_at'):
+            timestamps['created_at'] = datetime.fromisoformat(data['created_at'])
+        if data.get('updated_at'):
+            timestamps['updated_at'] = datetime.fromisoformat(data['updated_at'])
 
         return cls(
             job_id=data['job_id'],
@@ -71,11 +89,10 @@ class Job:
             posted_date=data.get('posted_date', ''),
             match_score=data.get('match_score', 0.0),
             status=data.get('status', 'discovered'),
-            created_at=created_at,
-            updated_at=updated_at
+            **timestamps
         )
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Application:
     """Job application data model."""
     application_id: str
@@ -3,71 +3,74 @@ Base scraper class for job portals.
 """
 
 import asyncio
+import hashlib
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from playwright.async_api import async_playwright, Browser, Page
+from contextlib import asynccontextmanager
+from concurrent.futures import Executor
+from typing import AsyncIterator, Callable, List, Dict, Any, Optional
+from playwright.async_api import Browser, BrowserContext, Page
 import random
 
+from ..utils.browser_pool import browser_pool, USER_AGENTS
+from ._description import _EXP_RES, _SALARY_RES, _clean_text, _first_match, _parse_description
+
 logger = logging.getLogger(__name__)
 
+# Pages a single scraper keeps open at once
+MAX_CONCURRENT_PAGES = 8
+
+# Descriptions at least this long are parsed in the CPU pool (when one is
+# provided); for shorter ones the inter-process round-trip costs more than it saves
+PROCESS_PARSE_MIN_CHARS = 20_000
+
 class BaseScraper(ABC):
     """Base class for all job portal scrapers."""
 
     def __init__(self, platform_name: str):
         self.platform_name = platform_name
         self.browser: Optional[Browser] = None
-        self.page: Optional[Page] = None
-        self.user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        ]
+        self.user_agents = USER_AGENTS
+        # Created lazily so it binds to the running event loop
+        self._page_sem: Optional[asyncio.Semaphore] = None
+        # Returns the process pool for long descriptions; set by ScraperManager,
+        # which only starts the pool on the first call
+        self.cpu_pool: Optional[Callable[[], Executor]] = None
 
     async def initialize_browser(self, headless: bool = True):
-        """Initialize browser instance."""
+        """Make sure the shared browser is running (safe to call repeatedly)."""
         try:
-            playwright = await async_playwright().start()
-            self.browser = await playwright.chromium.launch(
-                headless=headless,
-                args=[
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-blink-features=AutomationControlled'
-                ]
-            )
-
-            context = await self.browser.new_context(
-                user_agent=random.choice(self.user_agents),
-                viewport={'width': 1366, 'height': 768}
-            )
-
-            # Add stealth settings
-            await context.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined,
-                });
-                window.chrome = {
-                    runtime: {},
-                };
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5],
-                });
-            """)
-
-            self.page = await context.new_page()
-
+            await browser_pool.start(headless)
+            self.browser = browser_pool.browser
         except Exception as e:
             logger.error(f"Failed to initialize browser for {self.platform_name}: {e}")
             raise
 
-    async def close_browser(self):
-        """Close browser instance."""
-        try:
-            if self.browser:
-                await self.browser.close()
-        except Exception as e:
-            logger.error(f"Error closing browser: {e}")
+    async def new_page(self, headless: bool = True) -> Page:
+        """Open a page in the shared browser; the caller closes it when done."""
+        await self.initialize_browser(headless)
+        return await browser_pool.new_page(headless)
+
+    @asynccontextmanager
+    async def browser_context(self, headless: bool = True) -> AsyncIterator[BrowserContext]:
+        """Isolated context from the browser pool, closed on exit."""
+        await self.initialize_browser(headless)
+        async with browser_pool.context(headless) as context:
+            yield context
+
+    def _page_limit(self) -> asyncio.Semaphore:
+        """Semaphore bounding how many pages this scraper has open."""
+        if self._page_sem is None:
+            self._page_sem = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+        return self._page_sem
+
+    async def extract_jobs_details(self, job_urls: List[str]) -> List[Dict[str, Any]]:
+        """Extract details for several job postings concurrently."""
+        async def _extract(job_url: str) -> Dict[str, Any]:
+            async with self._page_limit():
+                return await self.extract_job_details(job_url)
+
+        return list(await asyncio.gather(*(_extract(job_url) for job_url in job_urls)))
 
     async def random_delay(self, min_seconds: int = 1, max_seconds: int = 3):
         """Add random delay to mimic human behavior."""
@@ -84,41 +87,43 @@ class BaseScraper(ABC):
         """Extract detailed job information from a job posting."""
         pass
 
+    async def close(self):
+        """Release scraper-specific resources (the shared browser is closed separately)."""
+        pass
+
+    def make_job_id(self, job_url: str) -> str:
+        """Build a job id from the posting URL that is stable across runs."""
+        digest = hashlib.blake2b(job_url.encode('utf-8'), digest_size=8).hexdigest()
+        return f"{self.platform_name.lower()}_{digest}"
+
     def clean_text(self, text: str) -> str:
         """Clean and normalize text data."""
-        if not text:
-            return ""
-        return " ".join(text.strip().split())
+        return _clean_text(text)
 
     def extract_salary_range(self, text: str) -> str:
         """Extract salary information from text."""
-        import re
-        salary_patterns = [
-            r'₹\s*(\d+(?:,\d+)*)\s*-\s*₹\s*(\d+(?:,\d+)*)',
-            r'(\d+(?:,\d+)*)\s*-\s*(\d+(?:,\d+)*)\s*LPA',
-            r'(\d+(?:.\d+)?)\s*-\s*(\d+(?:.\d+)?)\s*Lakh'
-        ]
-
-        for pattern in salary_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-
-        return ""
+        return _first_match(_SALARY_RES, text)
 
     def extract_experience_required(self, text: str) -> str:
         """Extract experience requirements from text."""
-        import re
-        exp_patterns = [
-            r'(\d+)\s*-\s*(\d+)\s*years?',
-            r'(\d+)\+\s*years?',
-            r'fresher',
-            r'entry\s*level'
-        ]
-
-        for pattern in exp_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-
-        return ""
+        return _first_match(_EXP_RES, text)
+
+    async def parse_description(self, description: str) -> Dict[str, str]:
+        """Clean a job description and pull salary/experience out of it.
+
+        Long descriptions go to cpu_pool so the regex work doesn't stall the
+        event loop.
+        """
+        if self.cpu_pool is not None and len(description) >= PROCESS_PARSE_MIN_CHARS:
+            loop = asyncio.get_running_loop()
+            cleaned, salary, experience = await loop.run_in_executor(
+                self.cpu_pool(), _parse_description, description
+            )
+        else:
+            cleaned, salary, experience = _parse_description(description)
+
+        return {
+            'description': cleaned,
+            'salary_range': salary,
+            'experience_required': experience
+        }
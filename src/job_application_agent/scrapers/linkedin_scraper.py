@@ -1,34 +1,53 @@
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional, cast
-from playwright.async_api import Page, ElementHandle
+from typing import List, Dict, Any, Optional
+from playwright.async_api import Page
 from .base_scraper import BaseScraper
 import urllib.parse
 
 logger = logging.getLogger(__name__)
 
+# Reads the first 10 result cards in one round-trip; missing elements come back as null
+_CARDS_JS = """
+() => [...document.querySelectorAll('.job-search-card')].slice(0, 10).map(card => {
+    const text = sel => { const el = card.querySelector(sel); return el ? el.innerText : null; };
+    const link = card.querySelector('a[data-control-name="job_search_job_result_click"]');
+    return {
+        title: text('.sr-only'),
+        company: text('.hidden-nested-link'),
+        location: text('.job-search-card__location'),
+        url: link ? link.getAttribute('href') : null
+    };
+})
+"""
+
 class LinkedInScraper(BaseScraper):
     """Scraper for LinkedIn job postings."""
 
     def __init__(self):
         super().__init__("LinkedIn")
         self.base_url = "https://www.linkedin.com"
-        self.page: Optional[Page] = None
-
-    def _check_page(self) -> Page:
-        """Check if page is initialized and return typed page object."""
-        if self.page is None:
-            raise RuntimeError("Browser page not initialized")
-        return cast(Page, self.page)
 
     async def search_jobs(self, keywords: List[str], location: str = "India", experience: str = "entry") -> List[Dict[str, Any]]:
         """Search for jobs on LinkedIn."""
+        # Each keyword gets its own page so the searches run concurrently
+        results = await asyncio.gather(*(
+            self._search_keyword(keyword, location, experience) for keyword in keywords
+        ))
+        jobs = [job for keyword_jobs in results for job in keyword_jobs]
+
+        logger.info(f"LinkedIn: Found {len(jobs)} jobs")
+        return jobs
+
+    async def _search_keyword(self, keyword: str, location: str, experience: str) -> List[Dict[str, Any]]:
+        """Search LinkedIn for a single keyword."""
         jobs = []
 
-        try:
-            await self.initialize_browser(headless=True)
-            page = self._check_page()
+        async with self._page_limit():
+            page: Optional[Page] = None
+            try:
+                page = await self.new_page(headless=True)
 
-            for keyword in keywords:
                 search_params = {
                     'keywords': keyword,
                     'location': location,
@@ -41,48 +60,32 @@ class LinkedInScraper(BaseScraper):
                 await page.goto(search_url)
                 await self.random_delay(2, 4)
 
-                job_elements = await page.query_selector_all('.job-search-card')
+                for card in await page.evaluate(_CARDS_JS):
+                    job_data = self._build_job(card)
+                    if job_data:
+                        job_data['experience_required'] = experience
+                        jobs.append(job_data)
 
-                for element in job_elements[:10]:
-                    try:
-                        job_data = await self._extract_job_card(element)
-                        if job_data:
-                            job_data['experience_required'] = experience
-                            jobs.append(job_data)
-                    except Exception as e:
-                        logger.warning(f"Error extracting job from LinkedIn: {e}")
-                        continue
+            except Exception as e:
+                logger.error(f"Error searching LinkedIn jobs: {e}")
 
-                await self.random_delay(3, 5)
+            finally:
+                if page:
+                    await page.close()
 
-        except Exception as e:
-            logger.error(f"Error searching LinkedIn jobs: {e}")
-
-        finally:
-            await self.close_browser()
-
-        logger.info(f"LinkedIn: Found {len(jobs)} jobs")
         return jobs
 
-    async def _extract_job_card(self, element: ElementHandle) -> Optional[Dict[str, Any]]:
-        """Extract job information from a single job card element."""
+    def _build_job(self, card: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Build a job dict from the fields read out of one job card."""
         try:
-            title_elem = await element.query_selector('.sr-only')
-            company_elem = await element.query_selector('.hidden-nested-link')
-            location_elem = await element.query_selector('.job-search-card__location')
-            link_elem = await element.query_selector('a[data-control-name="job_search_job_result_click"]')
-
-            if title_elem and company_elem and link_elem:
-                title = await title_elem.inner_text()
-                company = await company_elem.inner_text()
-                location_text = await location_elem.inner_text() if location_elem else ""
-                job_url = await link_elem.get_attribute('href')
-
-                if not job_url:
-                    return None
+            title = card.get('title')
+            company = card.get('company')
+            location_text = card.get('location') or ""
+            job_url = card.get('url')
 
+            if title is not None and company is not None and job_url:
                 return {
-                    'job_id': f"linkedin_{hash(job_url)}",
+                    'job_id': self.make_job_id(job_url),
                     'title': self.clean_text(title),
                     'company': self.clean_text(company),
                     'location': self.clean_text(location_text),
@@ -95,13 +98,13 @@ class LinkedInScraper(BaseScraper):
                 }
         except Exception as e:
             logger.warning(f"Error extracting job card data: {e}")
-            return None
+        return None
 
     async def extract_job_details(self, job_url: str) -> Dict[str, Any]:
         """Extract detailed job information from LinkedIn."""
+        page: Optional[Page] = None
         try:
-            await self.initialize_browser(headless=True)
-            page = self._check_page()
+            page = await self.new_page(headless=True)
             await page.goto(job_url)
             await self.random_delay(2, 4)
 
@@ -111,16 +114,14 @@ class LinkedInScraper(BaseScraper):
             description = await description_elem.inner_text() if description_elem else ""
             company = await company_elem.inner_text() if company_elem else ""
 
-            return {
-                'description': self.clean_text(description),
-                'company': self.clean_text(company),
-                'salary_range': self.extract_salary_range(description),
-                'experience_required': self.extract_experience_required(description)
-            }
+            details = await self.parse_description(description)
+            details['company'] = self.clean_text(company)
+            return details
 
         except Exception as e:
             logger.error(f"Error extracting LinkedIn job details: {e}")
             return {}
 
         finally:
-            await self.close_browser()
\ No newline at end of file
+            if page:
+                await page.close()
\ No newline at end of file
@@ -2,116 +2,286 @@
 Naukri.com job scraper implementation.
 """
 
+import asyncio
+import importlib.util
 import logging
-from typing import List, Dict, Any, Optional, cast
-from playwright.async_api import Page, ElementHandle
-from .base_scraper import BaseScraper
+import random
+from typing import List, Dict, Any, Optional
+from urllib.parse import urlsplit, urlunsplit
+from bs4 import BeautifulSoup
+from playwright.async_api import BrowserContext, Page, Route
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from .base_scraper import BaseScraper, USER_AGENTS
+from ..utils.rate_limiter import rate_limiter
+from ..utils.scrape_cache import scrape_cache
+
+# C-level (Lexbor) HTML parsing of fetched or rendered pages
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Plain HTTP fetch for server-rendered pages; the browser is only used when
+# this is unavailable or the page needs JavaScript
+HTTP_FAST_PATH_AVAILABLE = HTTPX_AVAILABLE and SELECTOLAX_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+# Connections the HTTP client keeps open to Naukri
+HTTP_MAX_CONNECTIONS = 50
+HTTP_TIMEOUT = 15.0
+# Key under which all Naukri requests share one pacing budget
+RATE_LIMIT_DOMAIN = "naukri.com"
+# How long to wait for result cards / the description to render
+SELECTOR_TIMEOUT_MS = 10_000
+
+# Reads every field of a job card in one round-trip; null when a required
+# element (title, company or link) is missing
+_CARD_JS = """
+el => {
+    const title = el.querySelector('.title');
+    const company = el.querySelector('.companyInfo');
+    const location = el.querySelector('.locationsContainer');
+    const link = el.querySelector('.title a');
+    if (!title || !company || !link) return null;
+    return {
+        title: title.innerText,
+        company: company.innerText,
+        location: location ? location.innerText : '',
+        url: link.getAttribute('href')
+    };
+}
+"""
+
+# Runs _CARD_JS over the first 10 result cards inside the page
+_CARDS_JS = f"els => els.slice(0, 10).map({_CARD_JS})"
+
+def _canonical_url(url: str) -> str:
+    """Posting URL without query/fragment (tracking parameters) or trailing slash."""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), '', ''))
+
+def _description_from_html(html: str) -> str:
+    """Text of the job description block in a Naukri posting page."""
+    if SELECTOLAX_AVAILABLE:
+        node = HTMLParser(html).css_first('.dang-inner-html')
+        return node.text(separator=' ') if node else ""
+
+    element = BeautifulSoup(html, 'lxml').select_one('.dang-inner-html')
+    return element.get_text(' ') if element else ""
+
+def _cards_from_html(html: str) -> List[Dict[str, Any]]:
+    """Same fields as _CARDS_JS, read from server-rendered result HTML."""
+    cards = []
+    for card in HTMLParser(html).css('.jobTuple')[:10]:
+        title = card.css_first('.title')
+        company = card.css_first('.companyInfo')
+        location = card.css_first('.locationsContainer')
+        link = card.css_first('.title a')
+        if not (title and company and link):
+            continue
+        cards.append({
+            'title': title.text(separator=' '),
+            'company': company.text(separator=' '),
+            'location': location.text(separator=' ') if location else '',
+            'url': link.attributes.get('href')
+        })
+    return cards
+
+# Only the text of a page is read, so these are never worth downloading
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+async def _block_heavy_resources(route: Route):
+    """Route handler aborting requests for _BLOCKED_RESOURCE_TYPES."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 class NaukriScraper(BaseScraper):
     """Scraper for Naukri.com job postings."""
 
     def __init__(self):
         super().__init__("Naukri")
         self.base_url = "https://www.naukri.com"
-        self.page: Optional[Page] = None
+        self._http: Optional["httpx.AsyncClient"] = None
+
+    def _http_client(self) -> "httpx.AsyncClient":
+        """Pooled HTTP client, created on first use."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                http2=importlib.util.find_spec('h2') is not None,
+                limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS),
+                timeout=HTTP_TIMEOUT,
+                follow_redirects=True,
+                headers={
+                    'User-Agent': random.choice(USER_AGENTS),
+                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                    'Accept-Language': 'en-IN,en;q=0.9'
+                }
+            )
+        return self._http
+
+    async def _fetch_html(self, url: str, selector: str) -> Optional[str]:
+        """Fetch url without a browser; None unless the page already contains selector."""
+        if not HTTP_FAST_PATH_AVAILABLE:
+            return None
+        try:
+            await rate_limiter.acquire(RATE_LIMIT_DOMAIN)
+            response = await self._http_client().get(url)
+        except Exception as e:
+            logger.debug("Naukri HTTP fetch failed, falling back to browser: %s", e)
+            return None
 
-    def _check_page(self) -> Page:
-        """Check if page is initialized and return typed page object."""
-        if self.page is None:
-            raise RuntimeError("Browser page not initialized")
-        return cast(Page, self.page)
+        # 403s and JS-rendered shells go through the browser instead
+        if response.status_code != 200:
+            return None
+        html = response.text
+        return html if HTMLParser(html).css_first(selector) is not None else None
+
+    async def close(self):
+        """Close the HTTP client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def search_jobs(self, keywords: List[str], location: str = "India", experience: str = "0-2") -> List[Dict[str, Any]]:
         """Search for jobs on Naukri."""
+        # Keywords are searched concurrently, bounded by the scraper's page limit
+        results = await asyncio.gather(*(
+            self._search_keyword(keyword, location, experience) for keyword in keywords
+        ), return_exceptions=True)
+
         jobs = []
+        for keyword, result in zip(keywords, results):
+            if isinstance(result, BaseException):
+                logger.error("Error searching Naukri jobs for '%s': %s", keyword, result)
+                continue
+            jobs.extend(result)
 
-        try:
-            await self.initialize_browser(headless=True)
-            page = self._check_page()
+        logger.info("Naukri: Found %s jobs", len(jobs))
+        return jobs
 
-            for keyword in keywords:
-                search_url = f"{self.base_url}/java-jobs?k={keyword.replace(' ', '%20')}&l={location}&experience={experience}"
-                await page.goto(search_url)
-                await self.random_delay(2, 4)
+    async def _search_keyword(self, keyword: str, location: str, experience: str) -> List[Dict[str, Any]]:
+        """Search Naukri for a single keyword."""
+        jobs = []
+        search_url = f"{self.base_url}/java-jobs?k={keyword.replace(' ', '%20')}&l={location}&experience={experience}"
 
-                job_elements = await page.query_selector_all('.jobTuple')
+        html = await self._fetch_html(search_url, '.jobTuple')
+        if html is not None:
+            for card in _cards_from_html(html):
+                job_data = self._build_job(card, experience)
+                if job_data:
+                    jobs.append(job_data)
+            return jobs
 
-                for element in job_elements[:10]:
-                    try:
-                        job_data = await self._extract_job_card(element, experience)
-                        if job_data:
-                            jobs.append(job_data)
-                    except Exception as e:
-                        logger.warning(f"Error extracting job from Naukri: {e}")
-                        continue
+        async with self._page_limit():
+            # A fresh context per keyword keeps Naukri sessions isolated while
+            # the pooled browsers stay warm
+            try:
+                async with self.browser_context(headless=True) as context:
+                    page = await self._new_page(context)
 
-                await self.random_delay(3, 5)
+                    await rate_limiter.acquire(RATE_LIMIT_DOMAIN)
+                    await page.goto(search_url, wait_until="domcontentloaded")
+                    await self._wait_for(page, '.jobTuple')
 
-        except Exception as e:
-            logger.error(f"Error searching Naukri jobs: {e}")
+                    if SELECTOLAX_AVAILABLE:
+                        # One content() round-trip, then parse locally in C
+                        cards = _cards_from_html(await page.content())
+                    else:
+                        cards = await page.eval_on_selector_all('.jobTuple', _CARDS_JS)
+                    for card in cards:
+                        job_data = self._build_job(card, experience) if card else None
+                        if job_data:
+                            jobs.append(job_data)
 
-        finally:
-            await self.close_browser()
+            except Exception as e:
+                logger.error("Error searching Naukri jobs: %s", e)
 
-        logger.info(f"Naukri: Found {len(jobs)} jobs")
         return jobs
 
-    async def _extract_job_card(self, element: ElementHandle, experience: str) -> Optional[Dict[str, Any]]:
-        """Extract job information from a single job card element."""
+    @staticmethod
+    async def _wait_for(page: Page, selector: str):
+        """Wait until selector is on the page; a page without it is read as is."""
         try:
-            title_elem = await element.query_selector('.title')
-            company_elem = await element.query_selector('.companyInfo')
-            location_elem = await element.query_selector('.locationsContainer')
-            link_elem = await element.query_selector('.title a')
-
-            if title_elem and company_elem and link_elem:
-                title = await title_elem.inner_text()
-                company = await company_elem.inner_text()
-                location_text = await location_elem.inner_text() if location_elem else ""
-                job_url = await link_elem.get_attribute('href')
-
-                if not job_url:
-                    return None
-
-                return {
-                    'job_id': f"naukri_{hash(job_url)}",
-                    'title': self.clean_text(title),
-                    'company': self.clean_text(company),
-                    'location': self.clean_text(location_text),
-                    'source_platform': self.platform_name,
-                    'source_url': job_url,
-                    'posted_date': 'recent',
-                    'description': '',
-                    'requirements': '',
-                    'salary_range': '',
-                    'experience_required': experience
-                }
-        except Exception as e:
-            logger.warning(f"Error extracting job card data: {e}")
+            await page.wait_for_selector(selector, timeout=SELECTOR_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            logger.debug("Naukri: '%s' did not appear on %s", selector, page.url)
+
+    @staticmethod
+    async def _new_page(context: BrowserContext) -> Page:
+        """Open a page that skips images, fonts, media and stylesheets."""
+        await context.route("**/*", _block_heavy_resources)
+        return await context.new_page()
+
+    def _build_job(self, card: Dict[str, Any], experience: str) -> Optional[Dict[str, Any]]:
+        """Build a job dict from the fields read out of one job card."""
+        job_url = card.get('url')
+        if not job_url:
             return None
 
-    async def extract_job_details(self, job_url: str) -> Dict[str, Any]:
-        """Extract detailed job information from Naukri."""
+        return {
+            'job_id': self.make_job_id(_canonical_url(job_url)),
+            'title': self.clean_text(card['title']),
+            'company': self.clean_text(card['company']),
+            'location': self.clean_text(card['location']),
+            'source_platform': self.platform_name,
+            'source_url': job_url,
+            'posted_date': 'recent',
+            'description': '',
+            'requirements': '',
+            'salary_range': '',
+            'experience_required': experience
+        }
+
+    async def extract_job_details(self, job_url: str, page: Optional[Page] = None) -> Dict[str, Any]:
+        """Extract detailed job information from Naukri.
+
+        Pass an open page to reuse it across calls; otherwise a context is
+        taken from the browser pool and released afterwards.
+        """
         try:
-            await self.initialize_browser(headless=True)
-            page = self._check_page()
-            await page.goto(job_url)
-            await self.random_delay(2, 4)
+            # Postings seen within the cache TTL are parsed without a browser;
+            # keyed like job ids so tracking/query variants share one entry
+            cache_key = f"naukri:detail:{_canonical_url(job_url)}"
+            html = await scrape_cache.get(cache_key)
+            if html is not None:
+                return await self.parse_description(_description_from_html(html))
+
+            html = await self._fetch_html(job_url, '.dang-inner-html')
+            if html is None:
+                html = await self._render_html(job_url, page)
 
-            description_elem = await page.query_selector('.dang-inner-html')
-            description = await description_elem.inner_text() if description_elem else ""
+            description = _description_from_html(html)
+            # Captcha, login-wall and half-loaded pages have no description
+            # and must not be served from the cache on later lookups
+            if description.strip():
+                await scrape_cache.put(cache_key, html)
 
-            return {
-                'description': self.clean_text(description),
-                'salary_range': self.extract_salary_range(description),
-                'experience_required': self.extract_experience_required(description)
-            }
+            return await self.parse_description(description)
 
         except Exception as e:
-            logger.error(f"Error extracting Naukri job details: {e}")
+            logger.error("Error extracting Naukri job details: %s", e)
             return {}
 
-        finally:
-            await self.close_browser()
\ No newline at end of file
+    async def _render_html(self, url: str, page: Optional[Page] = None) -> str:
+        """Load url in the browser (on page, or a pooled context) and return its HTML."""
+        async def load(page: Page) -> str:
+            await rate_limiter.acquire(RATE_LIMIT_DOMAIN)
+            await page.goto(url, wait_until="domcontentloaded")
+            await self._wait_for(page, '.dang-inner-html')
+            return await page.content()
+
+        if page is not None:
+            return await load(page)
+
+        async with self.browser_context(headless=True) as context:
+            return await load(await self._new_page(context))
\ No newline at end of file
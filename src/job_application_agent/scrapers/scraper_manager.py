@@ -4,14 +4,26 @@ Manager for all job scrapers.
 
 import logging
 import asyncio
-from typing import List, Dict, Any
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, List, Dict, Any, Optional
 from .linkedin_scraper import LinkedInScraper
 from .naukri_scraper import NaukriScraper
 from .indeed_scraper import IndeedScraper
+from ..utils.browser_pool import browser_pool
 from ..core.config import config
 
 logger = logging.getLogger(__name__)
 
+# (platform, keyword) searches running at once across all scrapers
+MAX_CONCURRENT_SEARCHES = 6
+# Jobs buffered between the searches and a stream_all_platforms consumer
+STREAM_QUEUE_SIZE = 256
+# Worker processes for parsing long descriptions; these are rare, so a couple
+# of workers is enough
+CPU_POOL_WORKERS = 2
+
 class ScraperManager:
     """Manages all job scrapers and coordinates job searching."""
 
@@ -21,53 +33,141 @@ class ScraperManager:
             'naukri': NaukriScraper(),
             'indeed': IndeedScraper()
         }
+        # Created lazily so it binds to the running event loop
+        self._search_sem: Optional[asyncio.Semaphore] = None
+
+        # Process pool for long descriptions, created on first use
+        self._cpu: Optional[ProcessPoolExecutor] = None
+        for scraper in self.scrapers.values():
+            scraper.cpu_pool = self._cpu_pool
+
+    def _cpu_pool(self) -> ProcessPoolExecutor:
+        """Return the description-parsing process pool, starting it if needed."""
+        if self._cpu is None:
+            # "spawn" avoids forking a process that already runs the event
+            # loop and logging threads
+            self._cpu = ProcessPoolExecutor(
+                max_workers=min(CPU_POOL_WORKERS, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._cpu
+
+    def _search_limit(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent (platform, keyword) searches."""
+        if self._search_sem is None:
+            self._search_sem = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+        return self._search_sem
 
     async def search_all_platforms(self) -> List[Dict[str, Any]]:
         """Search for jobs across all platforms."""
         all_jobs = []
+        found: Dict[str, int] = {}
+
+        async for job in self.stream_all_platforms():
+            platform_name = job.get('source_platform', '')
+            found[platform_name] = found.get(platform_name, 0) + 1
+            all_jobs.append(job)
 
+        for platform_name, count in found.items():
+            logger.info("%s: Found %s jobs", platform_name, count)
+        logger.info("Total jobs found across all platforms: %s", len(all_jobs))
+        return all_jobs
+
+    async def stream_all_platforms(self) -> AsyncIterator[Dict[str, Any]]:
+        """Yield jobs from all platforms as each search finishes.
+
+        Callers can start processing while slower platforms are still
+        being scraped; the bounded queue pauses searches if they fall behind.
+        """
         keywords = config.job_search.keywords
         locations = config.user_profile.preferred_locations
+        location = locations[0] if locations else "India"
 
-        # Create tasks for parallel scraping
-        tasks = []
-        for platform_name, scraper in self.scrapers.items():
-            task = asyncio.create_task(
-                self._search_platform(scraper, keywords, locations[0] if locations else "India")
-            )
-            tasks.append(task)
-
-        # Wait for all scrapers to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
 
-        # Collect results
-        for result in results:
-            if isinstance(result, list):
-                all_jobs.extend(result)
-            elif isinstance(result, Exception):
-                logger.error(f"Scraper failed: {result}")
+        async def produce(scraper, keyword: str):
+            for job in await self._search_platform(scraper, keyword, location):
+                await queue.put(job)
+            await queue.put(None)  # this search is done
 
-        logger.info(f"Total jobs found across all platforms: {len(all_jobs)}")
-        return all_jobs
+        # One task per (platform, keyword) so a slow platform or keyword
+        # doesn't hold up the rest
+        producers = [
+            asyncio.create_task(produce(scraper, keyword))
+            for scraper in self.scrapers.values() for keyword in keywords
+        ]
 
-    async def _search_platform(self, scraper, keywords: List[str], location: str) -> List[Dict[str, Any]]:
-        """Search a single platform."""
+        # The same posting is often listed on several platforms (and under
+        # several keywords); only the first copy is passed on
+        seen = set()
+        remaining = len(producers)
         try:
-            jobs = await scraper.search_jobs(keywords, location)
-            logger.info(f"{scraper.platform_name}: Found {len(jobs)} jobs")
-            return jobs
-        except Exception as e:
-            logger.error(f"Error searching {scraper.platform_name}: {e}")
-            return []
+            while remaining:
+                job = await queue.get()
+                if job is None:
+                    remaining -= 1
+                    continue
+
+                fingerprint = self._fingerprint(job)
+                if fingerprint in seen:
+                    continue
+                seen.add(fingerprint)
+                yield job
+        finally:
+            # Only has an effect if the caller stopped iterating early
+            for task in producers:
+                task.cancel()
+
+    @staticmethod
+    def _fingerprint(job: Dict[str, Any]) -> tuple:
+        """Key identifying a posting regardless of the platform it came from."""
+        return (
+            job.get('title', '').casefold(),
+            job.get('company', '').casefold(),
+            job.get('location', '').casefold()
+        )
+
+    async def _search_platform(self, scraper, keyword: str, location: str) -> List[Dict[str, Any]]:
+        """Search a single platform for a single keyword."""
+        async with self._search_limit():
+            try:
+                return await scraper.search_jobs([keyword], location)
+            except Exception as e:
+                logger.error("Error searching %s for '%s': %s", scraper.platform_name, keyword, e)
+                return []
 
     async def get_job_details(self, platform: str, job_url: str) -> Dict[str, Any]:
         """Get detailed job information from a specific platform."""
         if platform not in self.scrapers:
-            logger.error(f"Unknown platform: {platform}")
+            logger.error("Unknown platform: %s", platform)
             return {}
 
         try:
             return await self.scrapers[platform].extract_job_details(job_url)
         except Exception as e:
-            logger.error(f"Error getting job details from {platform}: {e}")
+            logger.error("Error getting job details from %s: %s", platform, e)
             return {}
+
+    async def get_jobs_details(self, platform: str, job_urls: List[str]) -> List[Dict[str, Any]]:
+        """Get detailed job information for several postings concurrently."""
+        if platform not in self.scrapers:
+            logger.error("Unknown platform: %s", platform)
+            return [{} for _ in job_urls]
+
+        try:
+            return await self.scrapers[platform].extract_jobs_details(job_urls)
+        except Exception as e:
+            logger.error("Error getting job details from %s: %s", platform, e)
+            return [{} for _ in job_urls]
+
+    async def close(self):
+        """Close the scrapers and the browser they share."""
+        for scraper in self.scrapers.values():
+            try:
+                await scraper.close()
+            except Exception as e:
+                logger.error("Error closing %s scraper: %s", scraper.platform_name, e)
+        if self._cpu is not None:
+            self._cpu.shutdown(wait=False)
+            self._cpu = None
+        await browser_pool.shutdown()
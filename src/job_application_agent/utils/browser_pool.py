@@ -0,0 +1,179 @@
+"""
+Pool of warm Playwright browsers shared by the scrapers.
+"""
+
+import asyncio
+import logging
+import random
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+
+from ..core.config import config
+
+logger = logging.getLogger(__name__)
+
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+]
+
+# Injected into every page of a pool context to hide automation hints
+_STEALTH_INIT_JS = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined,
+    });
+    window.chrome = {
+        runtime: {},
+    };
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5],
+    });
+"""
+
+# Chromium processes kept running; contexts are spread over them round-robin
+BROWSER_POOL_SIZE = 2
+
+class BrowserPool:
+    """Already-launched browsers that hand out short-lived contexts.
+
+    Launching Chromium costs hundreds of milliseconds, so the browsers are
+    started once on first use. Scrapers either open a page in the shared
+    default context or acquire an isolated context, which is closed again
+    on release while its browser stays warm. At most max_contexts acquired
+    contexts and shared-context pages exist at once
+    (config.browser.max_scraper_workers by default), whichever scraper asks
+    for them.
+    """
+
+    def __init__(self, size: int = BROWSER_POOL_SIZE, max_contexts: Optional[int] = None):
+        self.size = max(1, size)
+        self.max_contexts = max_contexts
+        self._playwright = None
+        self.browsers: List[Browser] = []
+        # Shared default context on the first browser, used by new_page()
+        self.shared_context: Optional[BrowserContext] = None
+        self._next = 0
+        # Created lazily so they bind to the running event loop
+        self._lock: Optional[asyncio.Lock] = None
+        self._context_sem: Optional[asyncio.Semaphore] = None
+
+    @property
+    def browser(self) -> Optional[Browser]:
+        """The browser holding the shared default context."""
+        return self.browsers[0] if self.browsers else None
+
+    async def start(self, headless: bool = True):
+        """Launch the pool's browsers if they aren't running yet."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self.shared_context is not None:
+                return
+
+            self._playwright = await async_playwright().start()
+            self.browsers = list(await asyncio.gather(*(
+                self._playwright.chromium.launch(
+                    headless=headless,
+                    args=[
+                        '--no-sandbox',
+                        '--disable-dev-shm-usage',
+                        '--disable-blink-features=AutomationControlled'
+                    ]
+                )
+                for _ in range(self.size)
+            )))
+
+            self.shared_context = await self._create_context(self.browsers[0])
+            logger.info(f"Scraper browser pool started ({self.size} browsers)")
+
+    @staticmethod
+    async def _create_context(browser: Browser) -> BrowserContext:
+        """Create a browser context with a random user agent and stealth settings."""
+        context = await browser.new_context(
+            user_agent=random.choice(USER_AGENTS),
+            viewport={'width': 1366, 'height': 768}
+        )
+
+        # Add stealth settings (once, for every page of the context)
+        await context.add_init_script(_STEALTH_INIT_JS)
+        return context
+
+    async def new_page(self, headless: bool = True) -> Page:
+        """Open a new page in the shared default context.
+
+        The page holds a slot of the same limit as acquire() until it is closed.
+        """
+        await self.start(headless)
+        assert self.shared_context is not None
+        limit = self._context_limit()
+        await limit.acquire()
+        try:
+            page = await self.shared_context.new_page()
+        except BaseException:
+            limit.release()
+            raise
+        page.once("close", lambda _: limit.release())
+        return page
+
+    def _context_limit(self) -> asyncio.Semaphore:
+        """Semaphore bounding acquired contexts across all scrapers."""
+        if self._context_sem is None:
+            limit = self.max_contexts or config.browser.max_scraper_workers
+            self._context_sem = asyncio.Semaphore(max(1, limit))
+        return self._context_sem
+
+    async def acquire(self, headless: bool = True) -> BrowserContext:
+        """Open an isolated context (own cookies and storage) on the next browser.
+
+        Waits while the maximum number of contexts is already in use.
+        """
+        await self.start(headless)
+        limit = self._context_limit()
+        await limit.acquire()
+        try:
+            browser = self.browsers[self._next % len(self.browsers)]
+            self._next += 1
+            return await self._create_context(browser)
+        except BaseException:
+            limit.release()
+            raise
+
+    async def release(self, context: BrowserContext):
+        """Close a context obtained from acquire(); its browser stays up."""
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser context: {e}")
+        finally:
+            self._context_limit().release()
+
+    @asynccontextmanager
+    async def context(self, headless: bool = True) -> AsyncIterator[BrowserContext]:
+        """``async with pool.context() as ctx`` around acquire()/release()."""
+        context = await self.acquire(headless)
+        try:
+            yield context
+        finally:
+            await self.release(context)
+
+    async def shutdown(self):
+        """Close all browsers; call once at process exit."""
+        try:
+            if self.shared_context:
+                await self.shared_context.close()
+            for browser in self.browsers:
+                await browser.close()
+            if self._playwright:
+                await self._playwright.stop()
+        except Exception as e:
+            logger.error(f"Error closing browser: {e}")
+        finally:
+            self.shared_context = None
+            self.browsers = []
+            self._playwright = None
+
+# Process-wide pool used by all scrapers
+browser_pool = BrowserPool()
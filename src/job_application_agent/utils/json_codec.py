@@ -0,0 +1,24 @@
+"""
+JSON encoding helpers backed by orjson when it is installed.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def dumps(data: Any) -> bytes:
+    """Serialize data to UTF-8 encoded JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Deserialize JSON from bytes or str."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
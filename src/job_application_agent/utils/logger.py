@@ -2,13 +2,31 @@
 Logging configuration for the application.
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
-def setup_logging(log_level: str = "INFO"):
-    """Setup logging configuration."""
+# Background thread writing queued log records; see setup_logging
+_listener: Optional[logging.handlers.QueueListener] = None
+
+def setup_logging(log_level: str = "INFO", force: bool = False) -> logging.handlers.QueueListener:
+    """Setup logging configuration.
+
+    Log calls only enqueue the record; a background QueueListener thread does
+    the console and file I/O so it never blocks the event loop. The listener
+    is returned; stop_logging() (also run at exit) flushes and stops it.
+
+    Calling this again returns the running listener untouched unless force
+    is set, in which case the old handlers are closed and rebuilt.
+    """
+    global _listener
+
+    if _listener is not None and not force:
+        return _listener
 
     # Create logs directory
     log_dir = Path("data/logs")
@@ -19,6 +37,7 @@ def setup_logging(log_level: str = "INFO"):
     logger.setLevel(getattr(logging, log_level.upper()))
 
     # Clear existing handlers
+    stop_logging()
     logger.handlers.clear()
 
     # Create formatters
@@ -34,26 +53,46 @@ def setup_logging(log_level: str = "INFO"):
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(simple_formatter)
-    logger.addHandler(console_handler)
 
     # File handler with rotation
     file_handler = logging.handlers.RotatingFileHandler(
         log_dir / "jobagent.log",
         maxBytes=10*1024*1024,  # 10MB
-        backupCount=5
+        backupCount=5,
+        delay=True  # opened on first write
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(detailed_formatter)
-    logger.addHandler(file_handler)
 
     # Separate error log
     error_handler = logging.handlers.RotatingFileHandler(
         log_dir / "errors.log",
         maxBytes=5*1024*1024,  # 5MB
-        backupCount=3
+        backupCount=3,
+        delay=True
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(detailed_formatter)
-    logger.addHandler(error_handler)
+
+    # Route everything through a queue drained by a background thread
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, error_handler,
+        respect_handler_level=True
+    )
+    listener.start()
+    _listener = listener
 
     logging.info("Logging system initialized")
+    return listener
+
+@atexit.register
+def stop_logging():
+    """Flush queued log records, stop the background listener and close its files."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
@@ -0,0 +1,38 @@
+"""
+Per-domain request pacing shared by the scrapers.
+"""
+
+import asyncio
+import random
+import time
+from typing import Dict
+
+# Minimum gap between two requests to the same domain, plus random jitter
+DEFAULT_MIN_INTERVAL = 1.0
+DEFAULT_JITTER = 1.0
+
+class DomainRateLimiter:
+    """Spaces out requests per domain without serializing the callers.
+
+    Each acquire() reserves the next free slot for its domain and sleeps only
+    until that slot, so concurrent scrapes keep overlapping their page loads
+    and parsing while the request rate to any one site stays bounded.
+    """
+
+    def __init__(self, min_interval: float = DEFAULT_MIN_INTERVAL, jitter: float = DEFAULT_JITTER):
+        self.min_interval = min_interval
+        self.jitter = jitter
+        # Monotonic time at which each domain may next be hit
+        self._next_slot: Dict[str, float] = {}
+
+    async def acquire(self, domain: str):
+        """Wait for this caller's turn to send a request to domain."""
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(domain, now))
+        self._next_slot[domain] = slot + self.min_interval + random.uniform(0, self.jitter)
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+# Process-wide limiter so every scraper shares the same per-domain budget
+rate_limiter = DomainRateLimiter()
@@ -0,0 +1,78 @@
+"""
+On-disk cache for scraped pages, keyed by URL with a time-to-live.
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+from ..core._threads import to_thread_fast
+from ..core.config import config
+
+logger = logging.getLogger(__name__)
+
+# Job postings rarely change within a day
+DEFAULT_TTL = 24 * 60 * 60
+
+class ScrapeCache:
+    """Gzipped page cache, sharded by the first two hex digits of sha256(key)."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.html.gz"
+
+    @staticmethod
+    def _read(path: Path, ttl: float) -> Optional[str]:
+        try:
+            if time.time() - path.stat().st_mtime > ttl:
+                return None
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _write(path: Path, text: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp name per writer, then an atomic swap into place
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    async def get(self, key: str, ttl: float = DEFAULT_TTL) -> Optional[str]:
+        """Return the cached text for key if younger than ttl seconds."""
+        try:
+            return await to_thread_fast(self._read, self._path(key), ttl)
+        except Exception as e:
+            logger.warning(f"Could not read scrape cache entry: {e}")
+            return None
+
+    async def put(self, key: str, text: str):
+        """Store text under key."""
+        try:
+            await to_thread_fast(self._write, self._path(key), text)
+        except Exception as e:
+            logger.warning(f"Could not write scrape cache entry: {e}")
+
+    async def get_or_fetch(self, key: str, ttl: float, fetch: Callable[[], Awaitable[str]]) -> str:
+        """Return the cached text for key, calling fetch() and caching its result on a miss."""
+        text = await self.get(key, ttl)
+        if text is not None:
+            return text
+
+        text = await fetch()
+        if text:
+            await self.put(key, text)
+        return text
+
+# Shared by all scrapers
+scrape_cache = ScrapeCache(config.data_dir / ".cache" / "scrape")